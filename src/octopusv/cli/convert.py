@@ -1,9 +1,13 @@
 import logging
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, compress
 from pathlib import Path
 
 import typer
 
-from octopusv.converter.base import get_alt_chrom_pos
+from octopusv.converter.base import get_event_alt_chrom_pos
 from octopusv.converter.bnd_keeping import BNDKeepingConverter
 from octopusv.converter.mpi2tra import MatePairIndependentToTRAConverter
 from octopusv.converter.mpm2tra import MatePairMergeToTRAConverter
@@ -76,31 +80,25 @@ def correct(
 ):
     """Correct SV events with optional quality filtering."""
 
-    # Determine input file
+    # Determine input/output files; the common case (exactly one way of
+    # specifying each) falls straight through
+    input_file = input_vcf or input_option
     if input_vcf and input_option:
         typer.echo(
             "Error: Please specify input file either as an argument or with -i/--input-file, not both.", err=True
         )
         raise typer.Exit(code=1)
-    if input_vcf:
-        input_file = input_vcf
-    elif input_option:
-        input_file = input_option
-    else:
+    if input_file is None:
         typer.echo("Error: Input file is required.", err=True)
         raise typer.Exit(code=1)
 
-    # Determine output file
+    output_file = output or output_option
     if output and output_option:
         typer.echo(
             "Error: Please specify output file either as an argument or with -o/--output-file, not both.", err=True
         )
         raise typer.Exit(code=1)
-    if output:
-        output_file = output
-    elif output_option:
-        output_file = output_option
-    else:
+    if output_file is None:
         typer.echo("Error: Output file is required.", err=True)
         raise typer.Exit(code=1)
 
@@ -109,15 +107,13 @@ def correct(
     contig_lines, same_chr_bnd_events, diff_chr_bnd_events, non_bnd_events = parse_vcf(input_file)
 
     # Initialize quality filter if any filtering parameters are provided
-    filter_params = [min_qual, max_qual, min_support, max_support, min_depth, max_depth,
-                     min_gq, min_svlen, max_svlen, filter_pass, exclude_nocall]
-    has_quality_filters = any([
-        min_qual is not None, max_qual is not None,
-        min_support is not None, max_support is not None,
-        min_depth is not None, max_depth is not None,
-        min_gq is not None, min_svlen is not None, max_svlen is not None,
-        filter_pass, exclude_nocall
-    ])
+    has_quality_filters = (
+        min_qual is not None or max_qual is not None
+        or min_support is not None or max_support is not None
+        or min_depth is not None or max_depth is not None
+        or min_gq is not None or min_svlen is not None or max_svlen is not None
+        or filter_pass or exclude_nocall
+    )
 
     if has_quality_filters:
         # Import QualityFilter only when needed
@@ -139,8 +135,8 @@ def correct(
 
         # Apply quality filtering to all event types
         def apply_quality_filter(events):
-            """Apply quality filter to a list of events."""
-            return [event for event in events if quality_filter.filter_event(event)]
+            """Apply quality filter to a list of events via a vectorized mask."""
+            return list(compress(events, quality_filter.build_mask(events)))
 
         # Filter all event categories
         same_chr_bnd_events = apply_quality_filter(same_chr_bnd_events)
@@ -186,110 +182,159 @@ def correct(
     single_TRA_transformer = SingleTRATransformer([SingleTRAToTRAConverter()])
     non_bnd_transformer = NonBNDTransformer([NonBNDConverter()])
 
-    # Apply all transformation strategies to the events
-    same_chr_sv_transformed_events = same_chr_sv_transformer.apply_transforms(same_chr_bnd_events)
-    mate_pair_transformed_events = mate_bnd_pair_transformer.apply_transforms(mate_bnd_pairs)
-    special_no_mate_diff_bnd_pair_transformed_events = special_no_mate_diff_bnd_pair_transformer.apply_transforms(
-        special_no_mate_diff_bnd_pairs
-    )
-    single_TRA_transformed_events = single_TRA_transformer.apply_transforms(other_single_TRA)
-    non_bnd_transformed_events = non_bnd_transformer.apply_transforms(non_bnd_events)
-
-    # Merge all transformed events
-    all_transformed_events = (
-            same_chr_sv_transformed_events
-            + mate_pair_transformed_events
-            + special_no_mate_diff_bnd_pair_transformed_events
-            + single_TRA_transformed_events
-            + non_bnd_transformed_events
-    )
+    # Apply all transformation strategies to the events. The five transformers
+    # work on disjoint event lists with no shared state, so they can run as a
+    # data-parallel fan-out across processes.
+    transform_jobs = [
+        (same_chr_sv_transformer, same_chr_bnd_events),
+        (mate_bnd_pair_transformer, mate_bnd_pairs),
+        (special_no_mate_diff_bnd_pair_transformer, special_no_mate_diff_bnd_pairs),
+        (single_TRA_transformer, other_single_TRA),
+        (non_bnd_transformer, non_bnd_events),
+    ]
+    max_workers = min(len(transform_jobs), os.cpu_count() or 1)
+    if max_workers > 1:
+        transformers, event_lists = zip(*transform_jobs)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            transformed = list(executor.map(_apply_transformer, transformers, event_lists))
+    else:
+        transformed = [_apply_transformer(transformer, events) for transformer, events in transform_jobs]
+
+    # Stream the per-transformer results straight into the writer: the lists
+    # in `transformed` already hold every event, so materializing their
+    # concatenation would only double peak memory. write_sv_vcf accepts any
+    # iterable and batches its own flushes.
+    all_transformed_events = chain.from_iterable(transformed)
 
     # Write the transformed events to the output file
     write_sv_vcf(contig_lines, all_transformed_events, output_file)
     typer.echo(f"Corrected SV events written to {output_file}")
 
 
-def find_mate_bnd_events(events, pos_tolerance=3):
-    """Find mate BND events."""
-    event_dict = {}
-    mate_bnd_pairs = []
+def _apply_transformer(transformer, events):
+    """Run one transformer over its events; module-level so it can cross process boundaries."""
+    return transformer.apply_transforms(events)
+
+
+def _find_bucketed_mate_key(buckets, chrom_a, pos_a, chrom_b, pos_b, pos_tolerance, bucket_size):
+    """Find the stored key matching (chrom_a, pos_a~, chrom_b, pos_b~) within pos_tolerance.
+
+    Instead of enumerating the (2*pos_tolerance+1)^2 candidate keys and probing the
+    dict for each one, stored keys are bucketed by (chrom_a, chrom_b, pos_a//bucket,
+    pos_b//bucket). A +/-pos_tolerance window spans at most two consecutive buckets
+    per position, so only up to four buckets need to be inspected. Candidates are
+    ranked by their signed position deltas to preserve the probing order of the old
+    exhaustive enumeration.
+    """
+    best_key = None
+    lo_a, hi_a = (pos_a - pos_tolerance) // bucket_size, (pos_a + pos_tolerance) // bucket_size
+    lo_b, hi_b = (pos_b - pos_tolerance) // bucket_size, (pos_b + pos_tolerance) // bucket_size
+    for bucket_a in (lo_a,) if lo_a == hi_a else (lo_a, hi_a):
+        for bucket_b in (lo_b,) if lo_b == hi_b else (lo_b, hi_b):
+            for candidate in buckets.get((chrom_a, chrom_b, bucket_a, bucket_b), ()):
+                if abs(candidate[1] - pos_a) <= pos_tolerance and abs(candidate[3] - pos_b) <= pos_tolerance:
+                    if best_key is None or (candidate[1], candidate[3]) < (best_key[1], best_key[3]):
+                        best_key = candidate
+    return best_key
+
+
+def _bucket_key(key, bucket_size):
+    """Compute the spatial bucket a stored event key belongs to."""
+    return (key[0], key[2], key[1] // bucket_size, key[3] // bucket_size)
+
+
+def _extract_keys(events):
+    """Pre-pass over events producing parallel key lists (struct-of-arrays layout).
+
+    Parses each event's ALT field exactly once and reads chrom/pos attributes up
+    front, so the matching loops below work on plain local lists instead of
+    re-running get_alt_chrom_pos and attribute lookups per probe. Chromosome
+    names are interned to small integer ids, so the bucket/dict keys hashed on
+    the hot path are pure int tuples. Events whose ALT cannot be parsed are
+    dropped here, mirroring the old per-loop skip.
+    """
+    chrom_ids = {}
+    chroms = []
+    positions = []
+    chroms_alt = []
+    positions_alt = []
+    kept_events = []
 
     for event in events:
         try:
-            chrom_alt, pos_alt = get_alt_chrom_pos(event.alt)
+            chrom_alt, pos_alt = get_event_alt_chrom_pos(event)
             if chrom_alt is None or pos_alt is None:
                 continue
-
-            key_for_searching = (event.chrom, event.pos, chrom_alt, pos_alt)
-
-            # Generate all possible reverse keys
-            possible_reverse_keys = []
-            for i in range(-pos_tolerance, pos_tolerance + 1):
-                for j in range(-pos_tolerance, pos_tolerance + 1):
-                    try:
-                        new_key = (chrom_alt, pos_alt + i, event.chrom, event.pos + j)
-                        possible_reverse_keys.append(new_key)
-                    except TypeError:
-                        continue
-
-            for reverse_key in possible_reverse_keys:
-                if reverse_key in event_dict:
-                    mate_bnd_pairs.append((event_dict.pop(reverse_key), event))
-                    break
-            else:
-                event_dict[key_for_searching] = event
-
+            chroms.append(chrom_ids.setdefault(event.chrom, len(chrom_ids)))
+            positions.append(event.pos)
+            chroms_alt.append(chrom_ids.setdefault(chrom_alt, len(chrom_ids)))
+            positions_alt.append(pos_alt)
+            kept_events.append(event)
         except (TypeError, ValueError) as e:
             logging.info(f"Error processing event: {e!s}")
             continue
 
+    return chroms, positions, chroms_alt, positions_alt, kept_events
+
+
+def find_mate_bnd_events(events, pos_tolerance=3):
+    """Find mate BND events."""
+    event_dict = {}
+    buckets = {}
+    mate_bnd_pairs = []
+    bucket_size = 2 * pos_tolerance + 1
+
+    chroms, positions, chroms_alt, positions_alt, kept_events = _extract_keys(events)
+
+    for idx, event in enumerate(kept_events):
+        chrom, pos = chroms[idx], positions[idx]
+        chrom_alt, pos_alt = chroms_alt[idx], positions_alt[idx]
+        key_for_searching = (chrom, pos, chrom_alt, pos_alt)
+
+        # Look up a stored mate with the reverse key orientation
+        reverse_key = _find_bucketed_mate_key(
+            buckets, chrom_alt, pos_alt, chrom, pos, pos_tolerance, bucket_size
+        )
+        if reverse_key is not None:
+            mate_bnd_pairs.append((event_dict.pop(reverse_key), event))
+            buckets[_bucket_key(reverse_key, bucket_size)].remove(reverse_key)
+        else:
+            if key_for_searching not in event_dict:
+                buckets.setdefault(_bucket_key(key_for_searching, bucket_size), []).append(key_for_searching)
+            event_dict[key_for_searching] = event
+
     return mate_bnd_pairs
 
 
 def find_no_mate_events(events, pos_tolerance=3):
     """Find no mate events."""
     event_dict = {}
+    buckets = {}
     mate_bnd_pairs = []
+    bucket_size = 2 * pos_tolerance + 1
 
-    for event in events:
-        try:
-            chrom_alt, pos_alt = get_alt_chrom_pos(event.alt)
-            if chrom_alt is None or pos_alt is None:
-                continue
+    chroms, positions, chroms_alt, positions_alt, kept_events = _extract_keys(events)
 
-            key = (event.chrom, event.pos, chrom_alt, pos_alt)
-
-            # Generate all possible reverse keys
-            possible_reverse_keys = []
-            for i in range(-pos_tolerance, pos_tolerance + 1):
-                for j in range(-pos_tolerance, pos_tolerance + 1):
-                    try:
-                        new_key = (chrom_alt, pos_alt + i, event.chrom, event.pos + j)
-                        possible_reverse_keys.append(new_key)
-                    except TypeError:
-                        continue
-
-            mate_found = False
-            for reverse_key in possible_reverse_keys:
-                if reverse_key in event_dict:
-                    for mate_event in event_dict[reverse_key]:
-                        mate_bnd_pairs.append((mate_event, event))
-                        event_dict[reverse_key].remove(mate_event)
-                        mate_found = True
-                        break
-                    if mate_found:
-                        if len(event_dict[reverse_key]) == 0:
-                            del event_dict[reverse_key]
-                        break
-
-            if not mate_found:
-                if key not in event_dict:
-                    event_dict[key] = []
-                event_dict[key].append(event)
+    for idx, event in enumerate(kept_events):
+        chrom, pos = chroms[idx], positions[idx]
+        chrom_alt, pos_alt = chroms_alt[idx], positions_alt[idx]
+        key = (chrom, pos, chrom_alt, pos_alt)
 
-        except (TypeError, ValueError) as e:
-            logging.info(f"Error processing event: {e!s}")
-            continue
+        # Look up a stored mate with the reverse key orientation
+        reverse_key = _find_bucketed_mate_key(
+            buckets, chrom_alt, pos_alt, chrom, pos, pos_tolerance, bucket_size
+        )
+        if reverse_key is not None:
+            mate_events = event_dict[reverse_key]
+            mate_bnd_pairs.append((mate_events.popleft(), event))
+            if not mate_events:
+                del event_dict[reverse_key]
+                buckets[_bucket_key(reverse_key, bucket_size)].remove(reverse_key)
+        else:
+            if key not in event_dict:
+                event_dict[key] = deque()
+                buckets.setdefault(_bucket_key(key, bucket_size), []).append(key)
+            event_dict[key].append(event)
 
     return [single_event for event_list in event_dict.values() for single_event in event_list]
 
@@ -297,40 +342,29 @@ def find_no_mate_events(events, pos_tolerance=3):
 def find_special_no_mate_diff_bnd_pair_and_other_single_tra(events, pos_tolerance=3):
     """Extract special no mate diff bnd pair and other single TRA events."""
     event_dict = {}
+    buckets = {}
     special_no_mate_diff_bnd_pair = []
     other_single_TRA = []
+    bucket_size = 2 * pos_tolerance + 1
 
-    for event in events:
-        try:
-            chrom_alt, pos_alt = get_alt_chrom_pos(event.alt)
-            if chrom_alt is None or pos_alt is None:
-                continue
-
-            key = (event.chrom, event.pos, chrom_alt, pos_alt)
-
-            # Generate all possible reverse keys
-            possible_reverse_keys = []
-            for i in range(-pos_tolerance, pos_tolerance + 1):
-                for j in range(-pos_tolerance, pos_tolerance + 1):
-                    try:
-                        new_key = (event.chrom, event.pos + i, chrom_alt, pos_alt + j)
-                        possible_reverse_keys.append(new_key)
-                    except TypeError:
-                        continue
+    chroms, positions, chroms_alt, positions_alt, kept_events = _extract_keys(events)
 
-            mate_found = False
-            for reverse_key in possible_reverse_keys:
-                if reverse_key in event_dict:
-                    special_no_mate_diff_bnd_pair.append((event_dict.pop(reverse_key), event))
-                    mate_found = True
-                    break
+    for idx, event in enumerate(kept_events):
+        chrom, pos = chroms[idx], positions[idx]
+        chrom_alt, pos_alt = chroms_alt[idx], positions_alt[idx]
+        key = (chrom, pos, chrom_alt, pos_alt)
 
-            if not mate_found:
-                event_dict[key] = event
-
-        except (TypeError, ValueError) as e:
-            logging.info(f"Error processing event: {e!s}")
-            continue
+        # Look up a stored mate with the same key orientation
+        reverse_key = _find_bucketed_mate_key(
+            buckets, chrom, pos, chrom_alt, pos_alt, pos_tolerance, bucket_size
+        )
+        if reverse_key is not None:
+            special_no_mate_diff_bnd_pair.append((event_dict.pop(reverse_key), event))
+            buckets[_bucket_key(reverse_key, bucket_size)].remove(reverse_key)
+        else:
+            if key not in event_dict:
+                buckets.setdefault(_bucket_key(key, bucket_size), []).append(key)
+            event_dict[key] = event
 
     other_single_TRA = list(event_dict.values())
     return special_no_mate_diff_bnd_pair, other_single_TRA
\ No newline at end of file
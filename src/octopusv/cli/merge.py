@@ -1,19 +1,49 @@
+import logging
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import typer
 
-from octopusv.merger.sv_merger import SVMerger
-from octopusv.merger.upset_plotter import UpSetPlotter
 from octopusv.merger.name_mapper import NameMapper
-from octopusv.utils.SV_classifier_by_chromosome import SVClassifiedByChromosome
-from octopusv.utils.SV_classifier_by_type import SVClassifierByType
-from octopusv.utils.svcf_parser import SVCFFileEventCreator
+from octopusv.utils.file_io import open_vcf_bytes
+
+
+# Precompiled matchers for the ID/length attributes inside a ##contig=<...> line
+_CONTIG_ID_RE = re.compile(r"(?:^|,)ID=([^,>]+)")
+_CONTIG_LENGTH_RE = re.compile(r"(?:^|,)length=([^,>]+)")
+
+
+def _read_contigs_from_header(filename):
+    """Read contig IDs and lengths from a single SVCF header.
+
+    Reads bytes with a large buffer and stops at the first non-"##" line, so
+    only the header block is ever touched and only matched contig lines are
+    decoded to unicode.
+    """
+    contigs = {}
+    with open_vcf_bytes(filename) as f:
+        for line in f:
+            if line.startswith(b"##contig"):
+                line = line.strip()
+                if line.startswith(b"##contig=<") and line.endswith(b">"):
+                    content = line[len(b"##contig=<"): -1].decode()
+                    id_match = _CONTIG_ID_RE.search(content)
+                    length_match = _CONTIG_LENGTH_RE.search(content)
+                    if id_match and length_match:
+                        contigs[id_match.group(1)] = length_match.group(1)
+            elif line[:2] != b"##":
+                break
+    return contigs
 
 
 def get_contigs_from_svcf(filenames):
     """Extract contig information from SVCF files.
 
+    Header reads are I/O-bound, so files are scanned concurrently with a small
+    thread pool; results are merged in input file order as before.
+
     Args:
         filenames (list): List of SVCF filenames.
 
@@ -21,26 +51,11 @@ def get_contigs_from_svcf(filenames):
         dict: Dictionary of contig IDs and their lengths.
     """
     contigs = {}
-    for filename in filenames:
-        with open(filename) as f:
-            for line in f:
-                if line.startswith("##contig"):
-                    # Parse contig information
-                    line = line.strip()
-                    if line.startswith("##contig=<") and line.endswith(">"):
-                        content = line[len("##contig=<"): -1]
-                        parts = content.split(",")
-                        contig_id = ""
-                        contig_length = ""
-                        for part in parts:
-                            if part.startswith("ID="):
-                                contig_id = part.split("=", 1)[1]
-                            elif part.startswith("length="):
-                                contig_length = part.split("=", 1)[1]
-                        if contig_id and contig_length:
-                            contigs[contig_id] = contig_length
-                elif not line.startswith("##"):
-                    break
+    if not filenames:
+        return contigs
+    with ThreadPoolExecutor(max_workers=min(8, len(filenames))) as executor:
+        for file_contigs in executor.map(_read_contigs_from_header, filenames):
+            contigs.update(file_contigs)
     return contigs
 
 
@@ -125,11 +140,12 @@ def merge(
     all_input_files = []
 
     # Debug: show what typer gives us
-    typer.echo(f"Debug: input_files from arguments: {input_files}")
-    typer.echo(f"Debug: input_option from -i: {input_option}")
+    logging.debug("input_files from arguments: %s", input_files)
+    logging.debug("input_option from -i: %s", input_option)
 
     # Check if user intended to use -i by looking at the command line
-    using_i_option = '-i' in sys.argv or '--input-file' in sys.argv
+    argv_set = frozenset(sys.argv)
+    using_i_option = '-i' in argv_set or '--input-file' in argv_set
 
     if using_i_option:
         # User used -i, so combine input_option first, then any positional args
@@ -146,7 +162,8 @@ def merge(
             all_input_files.extend(input_option)
 
     # Final debug output
-    typer.echo(f"Debug: Final file order: {[str(f) for f in all_input_files]}")
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("Final file order: %s", [str(f) for f in all_input_files])
 
     if not all_input_files:
         typer.echo("Error: No input files provided.", err=True)
@@ -202,6 +219,13 @@ def merge(
         typer.echo(f"Info: Caller order: {', '.join(caller_names_list)}")
         typer.echo(f"Info: Input file order: {[str(f) for f in all_input_files]}")
 
+    # Import the merger machinery only once the arguments validated; this keeps
+    # `octopusv merge --help` and argument errors fast.
+    from octopusv.merger.sv_merger import SVMerger
+    from octopusv.utils.SV_classifier_by_chromosome import SVClassifiedByChromosome
+    from octopusv.utils.SV_classifier_by_type import SVClassifierByType
+    from octopusv.utils.svcf_parser import SVCFFileEventCreator
+
     # Get contig information from input files
     input_filenames = [str(file) for file in all_input_files]
     contigs = get_contigs_from_svcf(input_filenames)
@@ -209,6 +233,26 @@ def merge(
     # Process SV events - maintain input file order throughout
     sv_event_creator = SVCFFileEventCreator(input_filenames)
     sv_event_creator.parse()
+
+    # Fast path: with a single input file and a plain union/intersect strategy
+    # there is nothing to merge across files, so skip the classifier/merger
+    # pipeline and pass the source-tagged events straight to the writer.
+    single_file_passthrough = (
+        len(all_input_files) == 1
+        and (union or intersect)
+        and not (expression or specific or exact_support is not None
+                 or min_support is not None or max_support is not None or upsetr)
+    )
+    if single_file_passthrough:
+        results = sv_event_creator.events
+        writer_merger = SVMerger({}, all_input_files=input_filenames)
+        writer_merger.write_results(output_file, results, contigs, mode, name_mapper)
+        typer.echo(f"Successfully merged {len(results)} events from {len(all_input_files)} input files.")
+        typer.echo(f"Merged results written to {output_file}")
+        if name_mapper:
+            typer.echo(f"SOURCES field and SAMPLE data are ordered consistently according to input file sequence.")
+        return
+
     classifier = SVClassifierByType(sv_event_creator.events)
     classifier.classify()
     chromosome_classifier = SVClassifiedByChromosome(classifier.get_classified_events())
@@ -260,6 +304,8 @@ def merge(
     # Generate UpSet plot if requested
     if upsetr:
         try:
+            from octopusv.merger.upset_plotter import UpSetPlotter
+
             plot_file = str(upsetr_output) if upsetr_output else str(output_file).rsplit(".", 1)[0] + "_upset.png"
             plotter = UpSetPlotter(sv_merger.get_all_merged_events(), all_input_files)
             plotter.plot(plot_file)
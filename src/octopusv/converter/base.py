@@ -1,10 +1,29 @@
 import logging
-import re
 
 from natsort import natsorted
 
 logging.basicConfig(level=logging.INFO)
 
+# Upper bound on how many BND events may share one breakpoint key before the
+# pair converters skip the cluster: real mate pairs come in twos, and scanning
+# a pathological pile-up of duplicated breakpoints is quadratic in its size.
+MAX_MATE_GROUP_SIZE = 16
+
+_BASES = frozenset("ACGTNacgtn")
+# Folds "]" onto "[" so a single split separates the bracketed locus.
+_BRACKET_TRANS = str.maketrans("]", "[")
+
+
+def _is_bases(segment):
+    """True when the segment is an (optionally empty) run of nucleotide codes."""
+    return all(c in _BASES for c in segment)
+
+
+def _is_locus(segment):
+    """True when the segment looks like chrom:pos with an all-digit position."""
+    chrom, sep, pos = segment.rpartition(":")
+    return bool(sep) and bool(chrom) and "[" not in chrom and "]" not in chrom and pos.isdigit()
+
 
 class Converter:
     """This is an abstract base class for all converter classes.
@@ -19,19 +38,26 @@ class Converter:
 
 def get_bnd_pattern(alt):
     """Get the pattern of BND: t[p[, t]p], ]p]t, [p[t.
-    This function uses regular expressions to match the ALT field,
-    considering possible multiple nucleotides in the sequences and special chromosome names.
+    Classification is a straight-line scan of the bracket placement instead of
+    four regex matches, considering possible multiple nucleotides in the
+    sequences and special chromosome names. Checks keep the historical
+    precedence: an ALT like [p:1[ with no sequence classifies as t[p[.
     """
-    patterns = {
-        "t[p[": r"^[ACGTNacgtn]*\[[^\[\]]+:\d+\[$",
-        "t]p]": r"^[ACGTNacgtn]*\][^\[\]]+:\d+\]$",
-        "[p[t": r"^\[[^\[\]]+:\d+\[[ACGTNacgtn]*$",
-        "]p]t": r"^\][^\[\]]+:\d+\][ACGTNacgtn]*$",
-    }
-
-    for pattern_name, regex in patterns.items():
-        if re.match(regex, alt):
-            return pattern_name
+    if not alt:
+        return None
+
+    last = alt[-1]
+    if last == "[" or last == "]":
+        head, sep, locus = alt[:-1].partition(last)
+        if sep and _is_bases(head) and _is_locus(locus):
+            return "t[p[" if last == "[" else "t]p]"
+
+    first = alt[0]
+    if first == "[" or first == "]":
+        locus, sep, tail = alt[1:].partition(first)
+        if sep and _is_locus(locus) and _is_bases(tail):
+            return "[p[t" if first == "[" else "]p]t"
+
     return None
 
 
@@ -45,7 +71,7 @@ def get_alt_chrom_pos(alt):
         if not any(b in alt for b in brackets):
             return None, None
 
-        parts = re.split(r"[\[\]]", alt)
+        parts = alt.translate(_BRACKET_TRANS).split("[")
         for part in parts:
             if ":" in part:
                 chrom, pos = part.split(":")
@@ -62,6 +88,53 @@ def get_alt_chrom_pos(alt):
         return None, None
 
 
+def get_event_alt_chrom_pos(event):
+    """Parse an event's ALT field, caching the result on the event object.
+
+    Several passes (the three mate finders, the BND converters) parse the same
+    ALT field repeatedly. The cache is keyed by the ALT string itself, so
+    converters that rewrite event.alt invalidate it naturally.
+    """
+    cached = getattr(event, "_alt_chrom_pos_cache", None)
+    if cached is not None and cached[0] == event.alt:
+        return cached[1]
+    result = get_alt_chrom_pos(event.alt)
+    event._alt_chrom_pos_cache = (event.alt, result)
+    return result
+
+
+def get_event_bnd_pattern(event):
+    """Classify an event's BND pattern, caching the result on the event object.
+
+    Companion to get_event_alt_chrom_pos: the pair converters classify the
+    same ALT string once per candidate pair, so the four-regex match is cached
+    keyed by the ALT string and recomputed only if event.alt is rewritten.
+    """
+    cached = getattr(event, "_bnd_pattern_cache", None)
+    if cached is not None and cached[0] == event.alt:
+        return cached[1]
+    result = get_bnd_pattern(event.alt)
+    event._bnd_pattern_cache = (event.alt, result)
+    return result
+
+
+def get_bnd_mate_key(event):
+    """Return the unordered breakpoint key shared by both mates of a BND pair.
+
+    The pair converters only merge two events that reference each other's
+    positions on the same chromosome, so both mates of a convertible pair
+    produce the same (chrom, low_pos, high_pos) key. Returns None when the
+    ALT does not point back to the event's own chromosome, in which case no
+    pair is possible anyway.
+    """
+    chrom_alt, pos_alt = get_event_alt_chrom_pos(event)
+    if pos_alt is None or chrom_alt != event.chrom:
+        return None
+    if event.pos <= pos_alt:
+        return (event.chrom, event.pos, pos_alt)
+    return (event.chrom, pos_alt, event.pos)
+
+
 def is_same_bnd_event(event1, event2) -> bool:
     """Define whether the BND represent the same TRA events, used by MatePairMergeToTRAConverter."""
     qualified_pairings = [
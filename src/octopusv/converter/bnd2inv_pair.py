@@ -1,6 +1,9 @@
+import copy
 import logging
-import re
-from .base import Converter, get_alt_chrom_pos, get_bnd_pattern
+from .base import MAX_MATE_GROUP_SIZE, Converter, get_bnd_mate_key, get_event_alt_chrom_pos, get_event_bnd_pattern
+
+# The two same-orientation patterns that form an inversion pair.
+_INV_PATTERNS = frozenset({"t]p]", "[p[t"})
 
 
 class BNDPairToINVConverter(Converter):
@@ -19,32 +22,59 @@ class BNDPairToINVConverter(Converter):
         Returns:
             tuple: (remaining_events, converted_inv_events)
         """
-        remaining_events = []
         converted_inv_events = []
-        processed_events = set()
-
-        # Use nested loop to check all pairs
-        for i, event1 in enumerate(events):
-            if id(event1) in processed_events:
+        # Indexed flags instead of an id()-keyed set: no hashing on the hot
+        # path, and the remaining pass is a plain positional scan.
+        processed = [False] * len(events)
+
+        # Bucket by the unordered breakpoint key both mates share, so only
+        # true mate candidates are ever compared instead of all O(n^2) pairs.
+        buckets = {}
+        for index, event in enumerate(events):
+            key = get_bnd_mate_key(event)
+            if key is not None:
+                buckets.setdefault(key, []).append(index)
+
+        for key, group in buckets.items():
+            if len(group) < 2:
                 continue
-
-            for j, event2 in enumerate(events[i + 1:], i + 1):
-                if id(event2) in processed_events:
+            if len(group) > MAX_MATE_GROUP_SIZE:
+                # Mate pairs come in twos; a pile-up this size at a single
+                # breakpoint is miscalled input and would scan quadratically.
+                logging.warning(
+                    "Skipping %d BND events sharing breakpoint %s:%d-%d; too many to be mate pairs",
+                    len(group), key[0], key[1], key[2],
+                )
+                continue
+            for i, index1 in enumerate(group):
+                if processed[index1]:
                     continue
-
-                # Check if this pair forms an INV
-                inv_event = self._check_and_convert_inv_pair(event1, event2)
-                if inv_event:
-                    converted_inv_events.append(inv_event)
-                    processed_events.add(id(event1))
-                    processed_events.add(id(event2))
-                    logging.debug(f"Converted BND pair {event1.id}-{event2.id} to INV event")
-                    break
-
-        # Add unprocessed events to remaining
-        for event in events:
-            if id(event) not in processed_events:
-                remaining_events.append(event)
+                event1 = events[index1]
+
+                for index2 in group[i + 1:]:
+                    if processed[index2]:
+                        continue
+                    event2 = events[index2]
+
+                    # Check if this pair forms an INV
+                    try:
+                        inv_event = self._check_and_convert_inv_pair(event1, event2)
+                    except Exception as e:
+                        logging.error("Error checking INV pair: %s", e)
+                        inv_event = None
+                    if inv_event:
+                        converted_inv_events.append(inv_event)
+                        processed[index1] = True
+                        processed[index2] = True
+                        logging.debug("Converted BND pair %s-%s to INV event", event1.id, event2.id)
+                        break
+
+        # Unprocessed events remain, in their original order; when nothing
+        # converted (the common case for a chromosome) return them all.
+        if converted_inv_events:
+            remaining_events = [event for k, event in enumerate(events) if not processed[k]]
+        else:
+            remaining_events = list(events)
 
         return remaining_events, converted_inv_events
 
@@ -56,56 +86,59 @@ class BNDPairToINVConverter(Converter):
         - They reference each other's positions
         - Same chromosome
         """
-        try:
-            # Both must be BND events
-            if not (event1.is_BND() and event2.is_BND()):
-                return None
-
-            # Must be on same chromosome
-            if event1.chrom != event2.chrom:
-                return None
-
-            pattern1 = get_bnd_pattern(event1.alt)
-            pattern2 = get_bnd_pattern(event2.alt)
-
-            chrom_alt1, pos_alt1 = get_alt_chrom_pos(event1.alt)
-            chrom_alt2, pos_alt2 = get_alt_chrom_pos(event2.alt)
-
-            # Check if they reference each other
-            if not (event1.chrom == chrom_alt1 and event2.chrom == chrom_alt2 and
-                    event1.pos == pos_alt2 and event2.pos == pos_alt1):
-                return None
-
-            # Check for INV pattern: both events have same pattern
-            if ((pattern1 == "t]p]" and pattern2 == "t]p]") or
-                    (pattern1 == "[p[t" and pattern2 == "[p[t")):
-                # Create INV event from the one with smaller position
-                start_pos = min(event1.pos, event2.pos)
-                end_pos = max(event1.pos, event2.pos)
-                base_event = event1 if event1.pos < event2.pos else event2
-                return self._create_inv_event(base_event, start_pos, end_pos)
+        # Both must be BND events
+        if not (event1.is_BND() and event2.is_BND()):
+            return None
 
+        # Must be on same chromosome; bind the hot fields locally since the
+        # peephole optimizer won't fold repeated attribute loads
+        chrom = event1.chrom
+        if chrom != event2.chrom:
             return None
+        pos1, pos2 = event1.pos, event2.pos
+
+        chrom_alt1, pos_alt1 = get_event_alt_chrom_pos(event1)
+        chrom_alt2, pos_alt2 = get_event_alt_chrom_pos(event2)
 
-        except Exception as e:
-            logging.error(f"Error checking INV pair: {e}")
+        # Check if they reference each other before classifying patterns;
+        # most rejected candidates fail here on plain integer compares
+        if not (chrom == chrom_alt1 and chrom == chrom_alt2 and
+                pos1 == pos_alt2 and pos2 == pos_alt1):
             return None
 
+        pattern1 = get_event_bnd_pattern(event1)
+        pattern2 = get_event_bnd_pattern(event2)
+
+        # Check for INV pattern: both events have same pattern
+        if pattern1 == pattern2 and pattern1 in _INV_PATTERNS:
+            # Create INV event from the one with smaller position
+            start_pos = min(pos1, pos2)
+            end_pos = max(pos1, pos2)
+            base_event = event1 if pos1 < pos2 else event2
+            return self._create_inv_event(base_event, start_pos, end_pos)
+
+        return None
+
     def _create_inv_event(self, base_event, start_pos, end_pos):
         """Create an INV event from base BND event."""
-        import copy
-        inv_event = copy.deepcopy(base_event)
+        chrom = base_event.chrom
+        inv_event = copy.copy(base_event)
+        # Only pos, alt and a handful of info keys change; a shallow clone
+        # plus a fresh info dict avoids deepcopy walking the whole event.
+        inv_event.info = dict(base_event.info)
 
         # Set to start position
         inv_event.pos = start_pos
 
-        # Modify to INV format
+        # Modify to INV format; end_pos >= start_pos by construction
         inv_event.alt = "<INV>"
-        inv_event.info["SVTYPE"] = "INV"
-        inv_event.info["END"] = end_pos
-        inv_event.info["SVLEN"] = abs(end_pos - start_pos)
-        inv_event.info["CHR2"] = inv_event.chrom
-        inv_event.info["SVMETHOD"] = "OctopuSV"
+        inv_event.info.update({
+            "SVTYPE": "INV",
+            "END": end_pos,
+            "SVLEN": end_pos - start_pos,
+            "CHR2": chrom,
+            "SVMETHOD": "OctopuSV",
+        })
 
         return inv_event
 
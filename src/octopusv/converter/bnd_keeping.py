@@ -24,15 +24,14 @@ class BNDKeepingConverter(Converter):
         """Update BND event info fields while preserving BND type."""
         chrom_alt, pos_alt = get_alt_chrom_pos(event.alt)
 
-        # Update basic info fields
-        if chrom_alt and pos_alt:
-            event.info["END"] = pos_alt
-            event.info["CHR2"] = chrom_alt
-        else:
-            event.info["END"] = "."
-            event.info["CHR2"] = "."
-
-        # Keep SVTYPE as BND (don't change it)
-        event.info["SVTYPE"] = "BND"
-        event.info["SVLEN"] = "."  # BND events don't have meaningful SVLEN
-        event.info["SVMETHOD"] = "OctopuSV"
\ No newline at end of file
+        # Update all fields in one batch; SVTYPE stays BND and BND events
+        # don't have a meaningful SVLEN
+        if not (chrom_alt and pos_alt):
+            chrom_alt = pos_alt = "."
+        event.info.update({
+            "END": pos_alt,
+            "CHR2": chrom_alt,
+            "SVTYPE": "BND",
+            "SVLEN": ".",
+            "SVMETHOD": "OctopuSV",
+        })
\ No newline at end of file
@@ -0,0 +1,119 @@
+import logging
+
+from .base import MAX_MATE_GROUP_SIZE, Converter, get_bnd_mate_key
+from .bnd2del import BNDPairToDELConverter
+from .bnd2dup_pair import BNDPairToDUPConverter
+from .bnd2inv_pair import BNDPairToINVConverter
+
+# The pair converters hold no per-call state, so one instance of each
+# serves every classifier instead of three allocations per construction.
+_DEL_CONVERTER = BNDPairToDELConverter()
+_DUP_CONVERTER = BNDPairToDUPConverter()
+_INV_CONVERTER = BNDPairToINVConverter()
+
+
+class BNDPairClassifier(Converter):
+    """Classify BND mate pairs into DEL, DUP or INV events in a single pass.
+
+    The three pair converters share the same bucketing and pair scan, so
+    running them back to back traverses the surviving events three times and
+    redoes the same candidate checks. This classifier buckets once and
+    dispatches each candidate pair through the DEL/DUP/INV checks in the same
+    order the sequential passes applied them; the checks are mutually
+    exclusive for a given pair, so the results are identical.
+    """
+
+    def __init__(self):
+        self._del_converter = _DEL_CONVERTER
+        self._dup_converter = _DUP_CONVERTER
+        self._inv_converter = _INV_CONVERTER
+
+    def find_and_convert(self, events):
+        """Find BND mate pairs and convert them in one traversal.
+
+        Args:
+            events: List of BND events to process
+
+        Returns:
+            tuple: (remaining_events, del_events, dup_events, inv_events)
+        """
+        converted_del_events = []
+        converted_dup_events = []
+        converted_inv_events = []
+        # Indexed flags instead of an id()-keyed set: no hashing on the hot
+        # path, and the remaining pass is a plain positional scan.
+        processed = [False] * len(events)
+        converted_any = False
+
+        # Bucket by the unordered breakpoint key both mates share, so only
+        # true mate candidates are ever compared instead of all O(n^2) pairs.
+        buckets = {}
+        for index, event in enumerate(events):
+            key = get_bnd_mate_key(event)
+            if key is not None:
+                buckets.setdefault(key, []).append(index)
+
+        for key, group in buckets.items():
+            if len(group) < 2:
+                continue
+            if len(group) > MAX_MATE_GROUP_SIZE:
+                # Mate pairs come in twos; a pile-up this size at a single
+                # breakpoint is miscalled input and would scan quadratically.
+                logging.warning(
+                    "Skipping %d BND events sharing breakpoint %s:%d-%d; too many to be mate pairs",
+                    len(group), key[0], key[1], key[2],
+                )
+                continue
+            for i, index1 in enumerate(group):
+                if processed[index1]:
+                    continue
+                event1 = events[index1]
+
+                for index2 in group[i + 1:]:
+                    if processed[index2]:
+                        continue
+                    event2 = events[index2]
+
+                    # A pair matches at most one of the three checks.
+                    try:
+                        converted = self._del_converter._check_and_convert_del_pair(event1, event2)
+                        if converted:
+                            target = converted_del_events
+                        else:
+                            converted = self._dup_converter._check_and_convert_dup_pair(event1, event2)
+                            if converted:
+                                target = converted_dup_events
+                            else:
+                                converted = self._inv_converter._check_and_convert_inv_pair(event1, event2)
+                                target = converted_inv_events
+                    except Exception as e:
+                        logging.error("Error checking BND pair: %s", e)
+                        converted = None
+
+                    if converted:
+                        target.append(converted)
+                        processed[index1] = True
+                        processed[index2] = True
+                        converted_any = True
+                        logging.debug(
+                            "Converted BND pair %s-%s to %s event",
+                            event1.id, event2.id, converted.info["SVTYPE"],
+                        )
+                        break
+
+        # When nothing converted (the common case for a chromosome) hand the
+        # list back as-is.
+        if converted_any:
+            remaining_events = [event for k, event in enumerate(events) if not processed[k]]
+        else:
+            remaining_events = list(events)
+
+        return remaining_events, converted_del_events, converted_dup_events, converted_inv_events
+
+    def convert(self, event):
+        """Standard convert method for compatibility with base Converter class.
+
+        Note: This method is not used for pair processing.
+        Use find_and_convert() instead for batch processing.
+        """
+        pass
@@ -6,9 +6,57 @@ such as quality scores, supporting reads, depth, and genotype quality.
 """
 
 import logging
+import operator
 import re
+from enum import IntEnum
+from functools import lru_cache
 from typing import Optional, Dict, Any
 
+import numpy as np
+
+# Fetches both columns in one C-level call per sample-field lookup.
+_FORMAT_AND_SAMPLE = operator.attrgetter("format", "sample")
+
+
+class _Stat(IntEnum):
+    """Counter slots for QualityFilter statistics."""
+
+    TOTAL = 0
+    PASSED = 1
+    QUAL = 2
+    SUPPORT = 3
+    DEPTH = 4
+    GQ = 5
+    SVLEN = 6
+    PASS_FIELD = 7
+    NOCALL = 8
+
+
+# Dict keys reported by get_stats, in counter-slot order.
+_STAT_KEYS = (
+    'total', 'passed', 'filtered_qual', 'filtered_support', 'filtered_depth',
+    'filtered_gq', 'filtered_svlen', 'filtered_pass', 'filtered_nocall',
+)
+
+
+@lru_cache(maxsize=4096)
+def _parse_int(value: str) -> Optional[int]:
+    """Parse a sample/INFO field string to int, or None if not numeric.
+
+    Pure integers like "42" skip the int(float(...)) round-trip; the float
+    path remains for values like "3.0". Memoized because the same handful
+    of strings ("0", "1", read counts) recur across every event.
+    """
+    if isinstance(value, str):
+        if value == "." or value == "":
+            return None
+        if value.isdigit() or (value[0] in "+-" and value[1:].isdigit()):
+            return int(value)
+    try:
+        return int(float(value))
+    except (ValueError, TypeError):
+        return None
+
 
 class QualityFilter:
     """Filter SVEvents based on quality attributes."""
@@ -52,18 +100,37 @@ class QualityFilter:
         self.filter_pass = filter_pass
         self.exclude_nocall = exclude_nocall
 
-        # Statistics
-        self.stats = {
-            'total': 0,
-            'passed': 0,
-            'filtered_qual': 0,
-            'filtered_support': 0,
-            'filtered_depth': 0,
-            'filtered_gq': 0,
-            'filtered_svlen': 0,
-            'filtered_pass': 0,
-            'filtered_nocall': 0
-        }
+        # FORMAT strings are highly repetitive within a VCF, so key->position
+        # layouts are cached per distinct FORMAT instead of rebuilding a
+        # key/value dict for every field lookup on every event.
+        self._format_cache: Dict[str, Dict[str, int]] = {}
+
+        # Only the configured rules, cheapest first: O(1) string checks, then
+        # QUAL (no split), then INFO-only SVLEN, then the rules that need
+        # FORMAT/SAMPLE field lookups. Rejected events exit on the first
+        # failing rule without ever paying for the expensive ones.
+        self._rule_chain = [
+            (check, stat_idx)
+            for check, stat_idx, configured in (
+                (self._check_filter_field, _Stat.PASS_FIELD, filter_pass),
+                (self._check_nocall_filter, _Stat.NOCALL, exclude_nocall),
+                (self._check_qual_filter, _Stat.QUAL,
+                 min_qual is not None or max_qual is not None),
+                (self._check_svlen_filter, _Stat.SVLEN,
+                 min_svlen is not None or max_svlen is not None),
+                (self._check_gq_filter, _Stat.GQ, min_gq is not None),
+                (self._check_support_filter, _Stat.SUPPORT,
+                 min_support is not None or max_support is not None),
+                (self._check_depth_filter, _Stat.DEPTH,
+                 min_depth is not None or max_depth is not None),
+            )
+            if configured
+        ]
+
+        # Statistics: flat integer counters indexed by _Stat, so the hot
+        # filter loop increments by position instead of hashing dict keys;
+        # get_stats materializes the keyed dict for callers.
+        self._stats = [0] * len(_Stat)
 
     def filter_event(self, event) -> bool:
         """Check if an SVEvent passes all filter criteria.
@@ -74,45 +141,118 @@ class QualityFilter:
         Returns:
             True if event passes all filters, False otherwise
         """
-        self.stats['total'] += 1
+        stats = self._stats
+        stats[_Stat.TOTAL] += 1
 
-        # QUAL filter
-        if not self._check_qual_filter(event):
-            self.stats['filtered_qual'] += 1
-            return False
+        for check, stat_idx in self._rule_chain:
+            if not check(event):
+                stats[stat_idx] += 1
+                return False
 
-        # FILTER field filter
-        if not self._check_filter_field(event):
-            self.stats['filtered_pass'] += 1
-            return False
+        stats[_Stat.PASSED] += 1
+        return True
 
-        # Support reads filter
-        if not self._check_support_filter(event):
-            self.stats['filtered_support'] += 1
-            return False
+    def build_mask(self, events) -> np.ndarray:
+        """Build a boolean keep-mask for a batch of events using numpy.
 
-        # Depth filter
-        if not self._check_depth_filter(event):
-            self.stats['filtered_depth'] += 1
-            return False
+        Value extraction stays in Python (it involves FORMAT/SAMPLE dict
+        parsing), but the threshold comparisons are composed as C-level
+        array operations instead of one Python call chain per event.
+        Missing values are encoded as NaN, which fails every `<`/`>`
+        comparison and therefore passes the corresponding filter, matching
+        filter_event. Statistics are attributed to the first failing check
+        in the same order as filter_event's rule chain.
 
-        # Genotype quality filter
-        if not self._check_gq_filter(event):
-            self.stats['filtered_gq'] += 1
-            return False
+        Args:
+            events: Sequence of SVEvent objects
 
-        # SV length filter
-        if not self._check_svlen_filter(event):
-            self.stats['filtered_svlen'] += 1
-            return False
+        Returns:
+            Boolean numpy array, True where the event passes all filters
+        """
+        n = len(events)
+        check_masks = []
+
+        # FILTER field filter
+        if self.filter_pass:
+            mask = np.fromiter((e.filter.upper() == "PASS" for e in events), dtype=bool, count=n)
+            check_masks.append((_Stat.PASS_FIELD, mask))
 
         # No-call genotype filter
-        if not self._check_nocall_filter(event):
-            self.stats['filtered_nocall'] += 1
-            return False
+        if self.exclude_nocall:
+            nocall_patterns = {"./.", ".|.", "."}
+            mask = np.fromiter(
+                (self._get_gt_value(e) not in nocall_patterns for e in events), dtype=bool, count=n,
+            )
+            check_masks.append((_Stat.NOCALL, mask))
 
-        self.stats['passed'] += 1
-        return True
+        # QUAL filter
+        if self.min_qual is not None or self.max_qual is not None:
+            quals = np.fromiter(
+                (v if (v := self._get_qual_value(e)) is not None else np.nan for e in events),
+                dtype=float, count=n,
+            )
+            mask = np.ones(n, dtype=bool)
+            if self.min_qual is not None:
+                mask &= ~(quals < self.min_qual)
+            if self.max_qual is not None:
+                mask &= ~(quals > self.max_qual)
+            check_masks.append((_Stat.QUAL, mask))
+
+        # SV length filter
+        if self.min_svlen is not None or self.max_svlen is not None:
+            svlens = np.fromiter(
+                (v if (v := self._get_svlen_value(e)) is not None else np.nan for e in events),
+                dtype=float, count=n,
+            )
+            mask = np.ones(n, dtype=bool)
+            if self.min_svlen is not None:
+                mask &= ~(svlens < self.min_svlen)
+            if self.max_svlen is not None:
+                mask &= ~(svlens > self.max_svlen)
+            check_masks.append((_Stat.SVLEN, mask))
+
+        # Genotype quality filter
+        if self.min_gq is not None:
+            gqs = np.fromiter(
+                (v if (v := self._get_gq_value(e)) is not None else np.nan for e in events),
+                dtype=float, count=n,
+            )
+            check_masks.append((_Stat.GQ, ~(gqs < self.min_gq)))
+
+        # Support reads filter
+        if self.min_support is not None or self.max_support is not None:
+            supports = np.fromiter(
+                (v if (v := self._get_support_value(e)) is not None else np.nan for e in events),
+                dtype=float, count=n,
+            )
+            mask = np.ones(n, dtype=bool)
+            if self.min_support is not None:
+                mask &= ~(supports < self.min_support)
+            if self.max_support is not None:
+                mask &= ~(supports > self.max_support)
+            check_masks.append((_Stat.SUPPORT, mask))
+
+        # Depth filter
+        if self.min_depth is not None or self.max_depth is not None:
+            depths = np.fromiter(
+                (v if (v := self._get_depth_value(e)) is not None else np.nan for e in events),
+                dtype=float, count=n,
+            )
+            mask = np.ones(n, dtype=bool)
+            if self.min_depth is not None:
+                mask &= ~(depths < self.min_depth)
+            if self.max_depth is not None:
+                mask &= ~(depths > self.max_depth)
+            check_masks.append((_Stat.DEPTH, mask))
+
+        stats = self._stats
+        stats[_Stat.TOTAL] += n
+        keep = np.ones(n, dtype=bool)
+        for stat_idx, mask in check_masks:
+            stats[stat_idx] += int(np.count_nonzero(keep & ~mask))
+            keep &= mask
+        stats[_Stat.PASSED] += int(np.count_nonzero(keep))
+        return keep
 
     def _check_qual_filter(self, event) -> bool:
         """Check QUAL score filters."""
@@ -231,12 +371,9 @@ class QualityFilter:
                 return self._safe_int(event.info[field])
 
         # Try FORMAT/SAMPLE fields
-        sample_dict = self._parse_sample_fields(event)
-        sample_fields = ["DV", "DR", "AD"]
-
-        for field in sample_fields:
-            if field in sample_dict:
-                value = sample_dict[field]
+        for field in ("DV", "DR", "AD"):
+            value = self._get_sample_field(event, field)
+            if value is not None:
                 if field == "AD":
                     # AD format: ref,alt - use alt count
                     parts = value.split(",")
@@ -249,15 +386,14 @@ class QualityFilter:
 
     def _get_depth_value(self, event) -> Optional[int]:
         """Extract depth value from event."""
-        sample_dict = self._parse_sample_fields(event)
-
         # Try DP field first
-        if "DP" in sample_dict:
-            return self._safe_int(sample_dict["DP"])
+        dp_value = self._get_sample_field(event, "DP")
+        if dp_value is not None:
+            return self._safe_int(dp_value)
 
         # Try to calculate from AD (ref + alt)
-        if "AD" in sample_dict:
-            ad_value = sample_dict["AD"]
+        ad_value = self._get_sample_field(event, "AD")
+        if ad_value is not None:
             parts = ad_value.split(",")
             if len(parts) >= 2:
                 ref_count = self._safe_int(parts[0])
@@ -269,9 +405,9 @@ class QualityFilter:
 
     def _get_gq_value(self, event) -> Optional[int]:
         """Extract genotype quality value from event."""
-        sample_dict = self._parse_sample_fields(event)
-        if "GQ" in sample_dict:
-            return self._safe_int(sample_dict["GQ"])
+        gq_value = self._get_sample_field(event, "GQ")
+        if gq_value is not None:
+            return self._safe_int(gq_value)
         return None
 
     def _get_svlen_value(self, event) -> Optional[int]:
@@ -283,30 +419,40 @@ class QualityFilter:
 
     def _get_gt_value(self, event) -> Optional[str]:
         """Extract genotype value from event."""
-        sample_dict = self._parse_sample_fields(event)
-        return sample_dict.get("GT")
+        return self._get_sample_field(event, "GT")
+
+    def _get_sample_field(self, event, key) -> Optional[str]:
+        """Look up one FORMAT/SAMPLE field using the cached FORMAT layout.
 
-    def _parse_sample_fields(self, event) -> Dict[str, str]:
-        """Parse FORMAT and SAMPLE fields into dictionary."""
+        Returns None when the key is absent from FORMAT or the SAMPLE column
+        is too short, like the old dict-of-all-fields lookup did.
+        """
         try:
-            format_parts = event.format.split(":")
-            sample_parts = event.sample.split(":")
-            return dict(zip(format_parts, sample_parts, strict=False))
-        except (AttributeError, ValueError):
-            return {}
+            format_str, sample_str = _FORMAT_AND_SAMPLE(event)
+            indices = self._format_cache.get(format_str)
+            if indices is None:
+                indices = {k: i for i, k in enumerate(format_str.split(":"))}
+                self._format_cache[format_str] = indices
+            index = indices.get(key)
+            if index is None:
+                return None
+            sample_parts = sample_str.split(":")
+            return sample_parts[index] if index < len(sample_parts) else None
+        except AttributeError:
+            return None
 
     def _safe_int(self, value) -> Optional[int]:
         """Safely convert value to integer."""
-        if value is None or value == "." or value == "":
+        if value is None:
             return None
         try:
-            return int(float(value))  # Handle "3.0" format
-        except (ValueError, TypeError):
+            return _parse_int(value)
+        except TypeError:  # Unhashable or otherwise unexpected value
             return None
 
     def get_stats(self) -> Dict[str, Any]:
         """Get filtering statistics."""
-        stats = self.stats.copy()
+        stats = dict(zip(_STAT_KEYS, self._stats))
         if stats['total'] > 0:
             stats['pass_rate'] = stats['passed'] / stats['total']
         else:
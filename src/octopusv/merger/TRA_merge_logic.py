@@ -1,3 +1,6 @@
+import re
+
+
 def should_merge_tra(event1, event2, delta=100, min_overlap_ratio=0.4, strand_consistency=True):
     """Determines whether two TRA events should be merged based on comprehensive pattern matching.
 
@@ -61,9 +64,6 @@ def _classify_bnd_pattern(alt):
     if not alt:
         return "UNKNOWN"
 
-    # Extract basic pattern structure
-    import re
-
     # Remove chromosome and position numbers but keep structure
     pattern = re.sub(r"chr\d+:\d+", "chrN:N", alt)
     pattern = re.sub(r"\d+:\d+", "N:N", pattern)
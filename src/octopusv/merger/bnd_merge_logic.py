@@ -1,4 +1,55 @@
-import re
+from functools import lru_cache
+
+
+def _next_bracket(text, start):
+    """Index of the first "[" or "]" at or after start, or -1."""
+    open_idx = text.find("[", start)
+    close_idx = text.find("]", start)
+    if open_idx == -1:
+        return close_idx
+    if close_idx == -1:
+        return open_idx
+    return min(open_idx, close_idx)
+
+
+def _scan_bnd_alt(alt_field):
+    """Tokenize a BND ALT string into its six parts without a regex.
+
+    Walks the fixed grammar seq? bracket chrom ":" digits bracket seq?
+    directly, retrying from each bracket like the old regex search did, so
+    malformed inputs classify the same way.
+
+    Returns:
+        tuple | None: (prefix, bracket1, target_chr, digits, bracket2, suffix)
+            or None when the ALT contains no such token.
+    """
+    n = len(alt_field)
+    prev_bracket = -1
+    bracket1 = _next_bracket(alt_field, 0)
+    while bracket1 != -1:
+        colon = alt_field.find(":", bracket1 + 1)
+        if colon == -1:
+            return None
+        next_bracket = _next_bracket(alt_field, bracket1 + 1)
+        if (next_bracket == -1 or colon < next_bracket) and colon > bracket1 + 1:
+            digits_end = colon + 1
+            while digits_end < n and alt_field[digits_end].isdigit():
+                digits_end += 1
+            if digits_end > colon + 1 and digits_end < n and alt_field[digits_end] in "[]":
+                suffix_end = _next_bracket(alt_field, digits_end + 1)
+                if suffix_end == -1:
+                    suffix_end = n
+                return (
+                    alt_field[prev_bracket + 1:bracket1],
+                    alt_field[bracket1],
+                    alt_field[bracket1 + 1:colon],
+                    alt_field[colon + 1:digits_end],
+                    alt_field[digits_end],
+                    alt_field[digits_end + 1:suffix_end],
+                )
+        prev_bracket = bracket1
+        bracket1 = next_bracket
+    return None
 
 
 def should_merge_bnd(event1, event2, delta=50):
@@ -15,9 +66,12 @@ def should_merge_bnd(event1, event2, delta=50):
     Returns:
         bool: True if events should be merged, False otherwise
     """
-    # Parse BND patterns and coordinates from both events
-    pattern1, target_chr1, target_pos1 = parse_bnd_alt(event1.alt)
-    pattern2, target_chr2, target_pos2 = parse_bnd_alt(event2.alt)
+    # Read the parse BNDMerger.add_event stashed on the event, falling back to
+    # parsing for callers that compare bare events
+    parsed1 = getattr(event1, "_bnd_parse", None)
+    parsed2 = getattr(event2, "_bnd_parse", None)
+    pattern1, target_chr1, target_pos1 = parsed1 if parsed1 is not None else parse_bnd_alt(event1.alt)
+    pattern2, target_chr2, target_pos2 = parsed2 if parsed2 is not None else parse_bnd_alt(event2.alt)
 
     # BND pattern must be identical (no reciprocal matching like TRA)
     if pattern1 != pattern2:
@@ -34,9 +88,14 @@ def should_merge_bnd(event1, event2, delta=50):
     return start_diff <= delta and target_diff <= delta
 
 
+@lru_cache(maxsize=None)
 def parse_bnd_alt(alt_field):
     """Parse BND ALT field to extract pattern, target chromosome, and position.
 
+    Results are memoized per ALT string: each event's ALT is parsed twice per
+    candidate pairing during merging, so the cache turns O(n^2) scans into
+    one parse per distinct breakend.
+
     Args:
         alt_field (str): BND ALT field value (e.g., "]chr2:186737138]N")
 
@@ -50,13 +109,12 @@ def parse_bnd_alt(alt_field):
         return "UNKNOWN", None, None
 
     try:
-        # Extract chromosome and position using regex
-        # Pattern: ]chr2:186737138]N or N[chr2:186737138[
-        match = re.search(r'([^\[\]]*)([\[\]])([^:\[\]]+):(\d+)([\[\]])([^\[\]]*)', alt_field)
-        if not match:
+        # Extract chromosome and position with a straight-line scan
+        token = _scan_bnd_alt(alt_field)
+        if token is None:
             return "UNKNOWN", None, None
 
-        prefix, bracket1, target_chr, target_pos_str, bracket2, suffix = match.groups()
+        prefix, bracket1, target_chr, target_pos_str, bracket2, suffix = token
         target_pos = int(target_pos_str)
 
         # Classify BND pattern based on bracket orientation and position
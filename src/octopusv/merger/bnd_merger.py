@@ -1,5 +1,53 @@
+from concurrent.futures import ProcessPoolExecutor
+
 from .sv_selector import select_representative_sv
-from .bnd_merge_logic import should_merge_bnd
+from .bnd_merge_logic import parse_bnd_alt, should_merge_bnd
+
+
+def _merge_chromosome_pair(unmerged_events, delta):
+    """Group nearly identical BND events of one chromosome pair.
+
+    Module-level (and dependent only on the event list and delta) so it can
+    be dispatched to worker processes; see BNDMerger.merge_events.
+
+    Returns:
+        list: Event groups in creation order, each a list of related events.
+    """
+    # Window width such that a representative within +-delta of an event
+    # always sits in the event's own or adjacent coarse position bucket.
+    bucket_size = 2 * delta + 1
+    merged_event_groups = []
+    # Groups indexed by the exact-match part of the merge criteria
+    # (source chrom, pattern, target chrom) plus a coarse position
+    # bucket, so each event is only tested against nearby groups that
+    # could actually merge - instead of every group so far. Among the
+    # candidates the earliest-created matching group wins, preserving
+    # the original first-match clustering.
+    group_index = {}
+    for current_event in unmerged_events:
+        parsed = getattr(current_event, "_bnd_parse", None)
+        pattern, target_chr, _ = parsed if parsed is not None else parse_bnd_alt(current_event.alt)
+        key = (current_event.chrom, pattern, target_chr)
+        pos = current_event.pos
+        lo = (pos - delta) // bucket_size
+        hi = (pos + delta) // bucket_size
+        best = None
+        for bucket in ((lo,) if lo == hi else (lo, hi)):
+            for entry in group_index.get((key, bucket), ()):
+                if (best is None or entry[0] < best[0]) and should_merge_bnd(
+                    entry[1], current_event, delta
+                ):
+                    best = entry
+        if best is not None:
+            # Add current event to existing group if it meets merge criteria
+            best[2].append(current_event)
+        else:
+            # Create new group if event doesn't match any existing groups
+            event_group = [current_event]
+            entry = (len(merged_event_groups), current_event, event_group)
+            merged_event_groups.append(event_group)
+            group_index.setdefault((key, pos // bucket_size), []).append(entry)
+    return merged_event_groups
 
 
 class BNDMerger:
@@ -13,18 +61,23 @@ class BNDMerger:
     and provides methods to merge nearly identical breakends.
     """
 
-    def __init__(self, delta=50):
+    def __init__(self, delta=50, n_workers=1):
         """Initialize the BND merger with configurable parameters.
 
         Args:
             delta (int): Distance threshold in base pairs for merging nearby breakpoints (default: 50)
                         This is more conservative than TRA merging to ensure precision
+            n_workers (int): Number of worker processes for per-chromosome-pair
+                        merging (default: 1, serial). Only worth raising for
+                        whole-genome catalogs with many chromosome pairs, since
+                        events must be pickled to and from the workers.
 
         The merger organizes BND events by chromosome pairs to efficiently handle
         breakpoints between specific chromosome combinations.
         """
         self.bnd_events = {}  # Dictionary to store BND events by chromosome pairs
         self.delta = delta
+        self.n_workers = n_workers
 
     def add_event(self, event):
         """Add a BND event to the merger, organizing events by chromosome pairs.
@@ -38,9 +91,11 @@ class BNDMerger:
         3. Initializes a new list for previously unseen chromosome pairs
         4. Adds the event to the appropriate chromosome pair's event list
         """
-        # Extract target chromosome from BND ALT field
-        from .bnd_merge_logic import parse_bnd_alt
-        _, target_chr, _ = parse_bnd_alt(event.alt)
+        # Extract target chromosome from BND ALT field; keep the full parse on
+        # the event so pairwise merging never re-parses the ALT string
+        parsed = parse_bnd_alt(event.alt)
+        event._bnd_parse = parsed
+        _, target_chr, _ = parsed
 
         if target_chr is None:
             # If we can't parse the target chromosome, use the event's own chromosome
@@ -63,30 +118,44 @@ class BNDMerger:
                 - Values are lists of event groups (each group contains related events)
 
         The merging process:
-        1. Iterates through each chromosome pair
+        1. Iterates through each chromosome pair (in parallel when n_workers > 1
+           and more than one pair exists - the pairs are fully independent)
         2. For each pair, groups nearly identical events based on:
            - Identical BND patterns (no reciprocal matching)
            - Breakpoint proximity (using delta)
            - Exact chromosome pair matching
         3. Maintains separate groups for non-matching events
         """
-        all_chromosome_pair_events = {}
-        for chromosome_pair, unmerged_events in self.bnd_events.items():
-            merged_event_groups = []
-            for current_event in unmerged_events:
-                event_was_merged = False
-                for _idx, event_group in enumerate(merged_event_groups):
-                    existing_event = event_group[0]
-                    if should_merge_bnd(existing_event, current_event, self.delta):
-                        # Add current event to existing group if it meets merge criteria
-                        event_group.append(current_event)
-                        event_was_merged = True
-                        break
-                if not event_was_merged:
-                    # Create new group if event doesn't match any existing groups
-                    merged_event_groups.append([current_event])
-            all_chromosome_pair_events[chromosome_pair] = merged_event_groups
-        return all_chromosome_pair_events
+        delta = self.delta
+        if self.n_workers > 1 and len(self.bnd_events) > 1:
+            with ProcessPoolExecutor(max_workers=self.n_workers) as pool:
+                futures = {
+                    chromosome_pair: pool.submit(_merge_chromosome_pair, unmerged_events, delta)
+                    for chromosome_pair, unmerged_events in self.bnd_events.items()
+                }
+                return {chromosome_pair: future.result() for chromosome_pair, future in futures.items()}
+        return {
+            chromosome_pair: _merge_chromosome_pair(unmerged_events, delta)
+            for chromosome_pair, unmerged_events in self.bnd_events.items()
+        }
+
+    def iter_merged_events(self):
+        """Yield merged BND events one representative at a time.
+
+        Generator counterpart of get_merged_events: consumers that only
+        iterate (e.g. streaming writers) never hold a second full list of
+        representatives alongside the grouped events.
+
+        Yields:
+            SVCFEvent: One representative per group of nearly identical BND
+                events, selected by quality metrics with source file
+                information already merged.
+        """
+        all_chromosome_pair_events = self.merge_events()
+        for _chromosome_pair, event_groups in all_chromosome_pair_events.items():
+            for event_group in event_groups:
+                # source_file merging is handled within select_representative_sv
+                yield select_representative_sv(event_group)
 
     def get_merged_events(self):
         """Get the final list of merged BND events with representative selection.
@@ -96,18 +165,5 @@ class BNDMerger:
                 - Represents a group of nearly identical BND events
                 - Is selected based on quality metrics (support, quality score, etc.)
                 - Contains merged source file information
-
-        Process:
-        1. Obtains grouped events from merge_events()
-        2. For each group, selects a representative event using select_representative_sv
-        3. Ensures source file information is properly merged
-        4. Returns the list of representative events
         """
-        all_chromosome_pair_events = self.merge_events()
-        merged_events = []
-        for _chromosome_pair, event_groups in all_chromosome_pair_events.items():
-            for event_group in event_groups:
-                representative_sv = select_representative_sv(event_group)
-                # source_file merging is handled within select_representative_sv
-                merged_events.append(representative_sv)
-        return merged_events
\ No newline at end of file
+        return list(self.iter_merged_events())
\ No newline at end of file
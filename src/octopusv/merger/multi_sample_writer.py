@@ -1,117 +1,196 @@
 import datetime
+import operator
 import os
+import queue
+import sys
+import threading
 from typing import List, Dict, Any
 from .name_mapper import NameMapper
+from .sv_merger import drain_writes, strip_missing_tail
+
+# Fetches all record fields in one C-level call instead of nine LOAD_ATTR
+# descriptor lookups per event.
+_EVENT_FIELDS = operator.attrgetter(
+    "chrom", "pos", "sv_id", "ref", "alt", "quality", "filter", "format", "info"
+)
 
 
 class MultiSampleWriter:
     """Handle writing VCF output for sample mode with consistent ordering."""
 
+    # Records are joined and written in batches of this size so large merges
+    # don't pay one buffered-writer round-trip per event.
+    _RECORDS_PER_WRITE = 4096
+
     def __init__(self, name_mapper: NameMapper):
         """Initialize writer with name mapper."""
         self.name_mapper = name_mapper
+        # Display names are stable for the writer's lifetime, so resolve them
+        # once instead of re-deriving them per source per event.
+        self._sample_names = name_mapper.get_all_display_names()
+        self._display_name_of = dict(zip(name_mapper.input_files, self._sample_names))
+        self._display_index = {name: i for i, name in enumerate(self._sample_names)}
+        # Consecutive events overwhelmingly share a FORMAT string, so the
+        # split key list and the matching missing-data fill are derived once
+        # per distinct FORMAT instead of per event.
+        self._fmt_cache = {}
+        # itemgetter per FORMAT key tuple: fetches all sample values in one
+        # C-level call when every key is present (the common case).
+        self._getter_cache = {}
+
+    def _values_getter(self, format_keys):
+        """Cached itemgetter over format_keys, or None when unusable."""
+        getter = self._getter_cache.get(format_keys)
+        if getter is None and format_keys not in self._getter_cache:
+            # A single-key getter returns a scalar rather than a tuple, so
+            # fall back to the per-key loop in that case
+            getter = operator.itemgetter(*format_keys) if len(format_keys) > 1 else None
+            self._getter_cache[format_keys] = getter
+        return getter
+
+    def _display_name(self, source_file):
+        """Cached equivalent of name_mapper.get_display_name."""
+        name = self._display_name_of.get(source_file)
+        if name is None:
+            name = self.name_mapper.get_display_name(source_file)
+            self._display_name_of[source_file] = name
+        return name
 
     def write_results(self, output_file, events, contigs, sv_merger):
         """Write merged results to output file with consistent SOURCES and SAMPLE ordering."""
-        with open(output_file, "w") as f:
+        # Binary mode with per-batch encoding skips the text layer's
+        # per-write encode and lock
+        with open(output_file, "wb", buffering=1 << 20) as f:
             self._write_header(f, contigs)
 
-            for event in events:
-                self._write_event(f, event, sv_merger)
+            # A background thread drains the queue so formatting the next
+            # batch overlaps with the previous batch's write syscall
+            write_queue = queue.Queue(maxsize=4)
+            writer_thread = threading.Thread(target=drain_writes, args=(write_queue, f), daemon=True)
+            writer_thread.start()
+            try:
+                record_buffer = []
+                for event in events:
+                    record_buffer.append(self._format_event(event, sv_merger))
+                    if len(record_buffer) >= self._RECORDS_PER_WRITE:
+                        write_queue.put("".join(record_buffer).encode("utf-8"))
+                        record_buffer.clear()
+                if record_buffer:
+                    write_queue.put("".join(record_buffer).encode("utf-8"))
+            finally:
+                write_queue.put(None)
+                writer_thread.join()
 
     def _write_header(self, file_handle, contigs):
         """Write VCF header including sample columns in input file order."""
         # Write standard VCF header
-        file_handle.write("##fileformat=SVCFv1.0\n")
         file_date = datetime.datetime.now().strftime("%Y-%m-%d|%I:%M:%S%p|")
-        file_handle.write(f"##fileDate={file_date}\n")
-        file_handle.write("##source=octopusV\n")
+        header_parts = [
+            "##fileformat=SVCFv1.0\n",
+            f"##fileDate={file_date}\n",
+            "##source=octopusV\n",
+        ]
 
         # Write contig information
         for contig_id, contig_length in contigs.items():
-            file_handle.write(f"##contig=<ID={contig_id},length={contig_length}>\n")
+            header_parts.append(f"##contig=<ID={contig_id},length={contig_length}>\n")
 
         # Write column headers for sample mode - ordered by input file sequence
-        sample_names = self.name_mapper.get_all_display_names()
-        header_line = "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\t" + "\t".join(sample_names) + "\n"
-        file_handle.write(header_line)
+        sample_names = self._sample_names
+        header_parts.append(
+            "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\t" + "\t".join(sample_names) + "\n"
+        )
+        file_handle.write("".join(header_parts).encode("utf-8"))
+
+    def _format_event(self, event, sv_merger):
+        """Format a single event record with consistent SOURCES and SAMPLE ordering."""
+        chrom, pos, sv_id, ref, alt, quality, filter_field, format_field, info = _EVENT_FIELDS(event)
 
-    def _write_event(self, file_handle, event, sv_merger):
-        """Write a single event record with consistent SOURCES and SAMPLE ordering."""
         # Step 1: Get ordered sources according to input file order
         ordered_sources = sv_merger._get_ordered_sources_for_event(event)
 
         # Step 2: Generate SOURCES field with consistent ordering
-        display_sources = ",".join([self.name_mapper.get_display_name(f) for f in ordered_sources])
+        display_sources = ",".join([self._display_name(f) for f in ordered_sources])
 
-        # Step 3: Prepare INFO field with ordered SOURCES
+        # Step 3: Prepare INFO field with ordered SOURCES; remember whether the
+        # loop emitted a SOURCES item instead of re-scanning the joined string
         info_items = []
-        for k, v in event.info.items():
+        sources_emitted = False
+        for k, v in info.items():
             if k == "SOURCES":
                 # Replace with our ordered sources using display names
                 info_items.append(f"SOURCES={display_sources}")
+                sources_emitted = True
             else:
                 info_items.append(f"{k}={v}")
 
+        if not sources_emitted:
+            info_items.append(f"SOURCES={display_sources}")
         info_field = ";".join(info_items)
-        if "SOURCES" not in info_field:
-            info_field += f";SOURCES={display_sources}"
 
-        # Step 4: Get FORMAT field
-        format_field = event.format
-        format_keys = format_field.split(":")
+        # Step 4: Get FORMAT keys and missing-data fill (cached per FORMAT)
+        cached_fmt = self._fmt_cache.get(format_field)
+        if cached_fmt is None:
+            # A tuple of interned keys: the same few FORMAT signatures recur
+            # across the whole file, so the per-sample dict lookups reuse
+            # identical key objects with cached hashes
+            format_keys = tuple(sys.intern(k) for k in format_field.split(":"))
+            missing_data = "0/0" + ":" + ":".join(["."] * (len(format_keys) - 1))
+            cached_fmt = (format_keys, missing_data)
+            self._fmt_cache[format_field] = cached_fmt
+        format_keys, missing_data = cached_fmt
 
         # Step 5: Format sample data for sample mode with consistent ordering
-        sample_part = self._format_sample_mode_output(event, format_keys, sv_merger, ordered_sources)
-
-        # Step 6: Write the complete record
-        record_part1 = f"{event.chrom}\t{event.pos}\t{event.sv_id}\t{event.ref}\t{event.alt}\t"
-        record_part2 = f"{event.quality}\t{event.filter}\t{info_field}\t{format_field}\t"
-        file_handle.write(record_part1 + record_part2 + sample_part + "\n")
-
-    def _format_sample_mode_output(self, event, format_keys, sv_merger, ordered_sources):
-        """Format output for sample mode with consistent ordering based on input file sequence.
+        sample_columns = self._format_sample_mode_output(event, format_keys, missing_data, sv_merger, ordered_sources)
+
+        # Step 6: Assemble the complete record with a single join instead of
+        # concatenating intermediate strings
+        fields = [
+            chrom,
+            str(pos),
+            sv_id,
+            ref,
+            alt,
+            str(quality),
+            filter_field,
+            info_field,
+            format_field,
+        ]
+        fields.extend(sample_columns)
+        return "\t".join(fields) + "\n"
+
+    def _format_sample_mode_output(self, event, format_keys, missing_data, sv_merger, ordered_sources):
+        """Format per-sample columns for sample mode, ordered by input file sequence.
 
         Args:
             event: The SV event object
             format_keys: List of FORMAT field keys
+            missing_data: Precomputed missing-data fill matching format_keys
             sv_merger: The SVMerger instance
             ordered_sources: List of source files in correct input order
-        """
-        sample_names = self.name_mapper.get_all_display_names()
 
-        # Get caller mode output data ordered by input file sequence
-        caller_mode_output = self._get_caller_mode_output_ordered(event, format_keys, sv_merger, ordered_sources)
+        Returns:
+            list: One formatted sample string per output sample column
+        """
+        # Get caller mode sample data ordered by input file sequence
+        caller_data_parts = self._get_caller_sample_list_ordered(event, format_keys, sv_merger, ordered_sources)
 
-        if not caller_mode_output or caller_mode_output == "./.":
+        if not caller_data_parts or caller_data_parts == ["./."]:
             # No data available, fill with missing data for all samples
-            missing_data = "0/0" + ":" + ":".join(["."] * (len(format_keys) - 1))
-            return "\t".join([missing_data] * len(sample_names))
-
-        # Split caller mode output into individual sample data pieces
-        caller_data_parts = caller_mode_output.split('\t')
-
-        # Map ordered sources to their corresponding display names and data
-        source_data_map = {}
-        for i, source_file in enumerate(ordered_sources):
-            if i < len(caller_data_parts):
-                sample_display_name = self.name_mapper.get_display_name(source_file)
-                source_data_map[sample_display_name] = caller_data_parts[i]
-
-        # Generate sample columns in the same order as header (input file order)
-        sample_columns = []
-        missing_data = "0/0" + ":" + ":".join(["."] * (len(format_keys) - 1))
-
-        for sample_name in sample_names:
-            if sample_name in source_data_map:
-                sample_columns.append(source_data_map[sample_name])
-            else:
-                sample_columns.append(missing_data)
+            return [missing_data] * len(self._sample_names)
 
-        return "\t".join(sample_columns)
+        # Place each source's data directly into its header column, leaving
+        # missing data everywhere else
+        sample_columns = [missing_data] * len(self._sample_names)
+        display_index = self._display_index
+        for source_file, sample_data in zip(ordered_sources, caller_data_parts):
+            column = display_index.get(self._display_name(source_file))
+            if column is not None:
+                sample_columns[column] = sample_data
+        return sample_columns
 
-    def _get_caller_mode_output_ordered(self, event, format_keys, sv_merger, ordered_sources):
-        """Get caller mode output with data ordered according to input file sequence.
+    def _get_caller_sample_list_ordered(self, event, format_keys, sv_merger, ordered_sources):
+        """Get caller mode sample data ordered according to input file sequence.
 
         Args:
             event: The SV event object
@@ -120,7 +199,8 @@ class MultiSampleWriter:
             ordered_sources: List of source files in correct input order
 
         Returns:
-            str: Tab-separated sample data ordered by input file sequence
+            list | None: Per-source sample strings ordered by input file
+                sequence, or None when the event carries no sample data
         """
         merged_samples = getattr(event, "merged_samples", [])
         if merged_samples:
@@ -129,28 +209,29 @@ class MultiSampleWriter:
 
             # Format samples in the correct order
             sample_strings = []
+            getter = self._values_getter(format_keys)
             for _, _, sample_data in reordered_samples:
                 if isinstance(sample_data, dict):
-                    values = []
-                    for key in format_keys:
-                        value = sample_data.get(key, ".")
-                        values.append(str(value))
-                    sample_str = ":".join(values)
-                    if sample_str.endswith(":.:."):
-                        sample_str = sample_str[:-4]
-                    sample_strings.append(sample_str)
+                    if getter is not None:
+                        try:
+                            values = [str(v) for v in getter(sample_data)]
+                        except KeyError:
+                            values = [str(sample_data.get(key, ".")) for key in format_keys]
+                    else:
+                        values = [str(sample_data.get(key, ".")) for key in format_keys]
+                    # Drop the two trailing missing fields the old ":.:."
+                    # suffix trim removed, before joining instead of
+                    # building the full string and slicing it
+                    if len(values) > 2 and values[-1] == "." and values[-2] == ".":
+                        del values[-2:]
+                    sample_strings.append(":".join(values))
                 else:
-                    sample_str = str(sample_data)
-                    if sample_str.endswith(":.:."):
-                        sample_str = sample_str[:-4]
-                    sample_strings.append(sample_str)
+                    sample_strings.append(strip_missing_tail(str(sample_data)))
 
-            return "\t".join(sample_strings)
+            return sample_strings
         elif hasattr(event, "sample"):
             # Single sample case
-            formatted_values = sv_merger.format_sample_values(format_keys, event.sample)
-            if formatted_values.endswith(":.:."):
-                formatted_values = formatted_values[:-4]
-            return formatted_values
+            formatted_values = strip_missing_tail(sv_merger.format_sample_values(format_keys, event.sample))
+            return [formatted_values] if formatted_values else None
         else:
-            return "./."
\ No newline at end of file
+            return None
\ No newline at end of file
@@ -19,32 +19,47 @@ class NameMapper:
         self.custom_names = custom_names
         self._validate_custom_names()
 
+        # The mapping never changes after construction, so resolve each input
+        # file's display name once instead of list.index-scanning per lookup.
+        if custom_names:
+            self._display_by_path = dict(zip(self.input_files, custom_names))
+        else:
+            self._display_by_path = {f: self._default_name(f) for f in self.input_files}
+        self._all_display_names = [self._display_by_path[f] for f in self.input_files]
+        self._source_string_cache: dict = {}
+
     def _validate_custom_names(self):
         """Validate that custom names count matches file count."""
         if self.custom_names and len(self.custom_names) != len(self.input_files):
             raise ValueError(
                 f"Number of custom names ({len(self.custom_names)}) doesn't match number of files ({len(self.input_files)})")
 
+    @staticmethod
+    def _default_name(file_path: str) -> str:
+        """Extract the default display name from a filename."""
+        return os.path.splitext(os.path.basename(file_path))[0]
+
     def get_display_name(self, file_path: str) -> str:
         """Get display name for a single file."""
-        if self.custom_names:
-            try:
-                file_index = self.input_files.index(str(file_path))
-                return self.custom_names[file_index]
-            except (ValueError, IndexError):
-                pass
+        name = self._display_by_path.get(str(file_path))
+        if name is not None:
+            return name
 
         # Default: extract from filename
-        return os.path.splitext(os.path.basename(str(file_path)))[0]
+        return self._default_name(str(file_path))
 
     def get_all_display_names(self) -> List[str]:
         """Get display names for all input files."""
-        return [self.get_display_name(f) for f in self.input_files]
+        return list(self._all_display_names)
 
     def convert_source_string(self, source_file_str: str) -> str:
         """Convert comma-separated source file string to display names."""
-        source_files = source_file_str.split(",")
-        display_names = []
-        for source_file in source_files:
-            display_names.append(self.get_display_name(source_file.strip()))
-        return ",".join(display_names)
\ No newline at end of file
+        # The same SOURCES strings recur across many events, so cache the
+        # converted form per raw string.
+        converted = self._source_string_cache.get(source_file_str)
+        if converted is None:
+            converted = ",".join(
+                self.get_display_name(source_file.strip()) for source_file in source_file_str.split(",")
+            )
+            self._source_string_cache[source_file_str] = converted
+        return converted
@@ -1,3 +1,10 @@
+# Upper bound on the start-position distance should_merge can ever accept:
+# the largest base threshold below (INS, 200) times the largest size
+# adjustment (x2 for events >= 1kb). Lets callers index events by coarse
+# position buckets without missing any mergeable pair.
+MAX_DISTANCE_THRESHOLD = 400
+
+
 def should_merge(event1, event2, max_distance=50, max_length_ratio=1.3, min_jaccard=0.7):
     """Determines whether two SV events should be merged based on simple position and length comparison.
 
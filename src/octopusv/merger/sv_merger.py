@@ -1,13 +1,41 @@
 import datetime
+import itertools
+import operator
 import os
+import queue
 import re
+import sys
+import threading
 
-from .sv_merge_logic import should_merge
+from .sv_merge_logic import MAX_DISTANCE_THRESHOLD, should_merge
 from .sv_selector import select_representative_sv
 from .tra_merger import TRAMerger
 from .bnd_merger import BNDMerger
 
 
+def drain_writes(write_queue, file_handle):
+    """Write encoded batches from a queue until the None sentinel arrives.
+
+    Run on a background thread so record formatting overlaps with the
+    write syscalls, which release the GIL.
+    """
+    while True:
+        blob = write_queue.get()
+        if blob is None:
+            return
+        file_handle.write(blob)
+
+
+def strip_missing_tail(sample_str):
+    """Drop the two optional trailing missing fields from a formatted sample string.
+
+    Writers trim exactly one ":.:." suffix - the two optional FORMAT fields
+    when both are absent - so the check is a fixed suffix test, not a strip
+    of arbitrarily many missing fields.
+    """
+    return sample_str[:-4] if sample_str.endswith(":.:.") else sample_str
+
+
 class SVMerger:
     def __init__(
             self,
@@ -43,39 +71,161 @@ class SVMerger:
         self.max_distance = max_distance
         self.max_length_ratio = max_length_ratio
         self.min_jaccard = min_jaccard
+        self._input_basenames = {os.path.basename(f) for f in self.all_input_files}
+        self._input_file_order = {os.path.basename(f): i for i, f in enumerate(self.all_input_files)}
+        self._partition_cache = None
+        self._all_merged_cache = None
+        # Per (sv_type, chromosome) map of coarse start-position bucket ->
+        # indices into merged_events, so each new event is only compared
+        # against nearby existing events. Bucket width equals the largest
+        # distance should_merge can accept, so probing the event's own and
+        # both neighbouring buckets covers every possible merge partner.
+        self._pos_index: dict[str, dict[str, dict[int, list[int]]]] = {}
+        # Expression filtering machinery, built once: identifier per input
+        # basename and a cache of expressions compiled to mask predicates.
+        self._identifier_by_basename = {
+            basename: re.sub(r"\W|^(?=\d)", "_", basename) for basename in self._input_basenames
+        }
+        self._compiled_expr_cache = {}
+        # Source membership as integer bitmasks: one bit per known basename,
+        # so the per-event set intersections in get_events_by_source collapse
+        # to single AND/compare operations. Basenames seen later (unexpected
+        # sources on events or in queries) get bits assigned on demand so
+        # comparisons stay consistent.
+        self._file_bit: dict[str, int] = {}
+        for f in self.all_input_files:
+            basename = os.path.basename(f)
+            if basename not in self._file_bit:
+                self._file_bit[basename] = 1 << len(self._file_bit)
+        self._input_files_mask = (1 << len(self._file_bit)) - 1
+        self._next_bit = len(self._file_bit)
+        # Expressions compile to predicates over the bitmask: both the raw
+        # basename and its sanitized identifier resolve to the same bit, and
+        # the rewriting regex matches either form (longest first).
+        self._bit_by_token = {}
+        for basename, identifier in self._identifier_by_basename.items():
+            bit = self._file_bit[basename]
+            self._bit_by_token[basename] = bit
+            self._bit_by_token[identifier] = bit
+        self._token_re = (
+            re.compile(
+                r"\b(" + "|".join(re.escape(t) for t in sorted(self._bit_by_token, key=len, reverse=True)) + r")\b"
+            )
+            if self._bit_by_token
+            else None
+        )
+
+    def _bit_for(self, basename):
+        """Get (or assign) the membership bit for a source basename."""
+        bit = self._file_bit.get(basename)
+        if bit is None:
+            bit = 1 << self._next_bit
+            self._file_bit[basename] = bit
+            self._next_bit += 1
+        return bit
+
+    def _source_mask(self, event):
+        """Get the event's source membership bitmask, cached on it.
+
+        Keyed by the source_file string itself, so representatives whose
+        sources are extended by later merging recompute naturally.
+        """
+        source_file = event.source_file
+        cached = getattr(event, "_source_mask_cache", None)
+        if cached is not None and cached[0] == source_file:
+            return cached[1]
+        mask = 0
+        for s in source_file.split(","):
+            mask |= self._bit_for(os.path.basename(s))
+        event._source_mask_cache = (source_file, mask)
+        return mask
 
     def merge(self):
         """Merge all SV events based on their types and chromosomes."""
+        self._partition_cache = None
+        self._all_merged_cache = None
+        # Hoist bound methods, per-chromosome lists, and the should_merge
+        # thresholds out of the per-event loops; the inner loops otherwise
+        # redo the same dict and attribute lookups millions of times.
+        max_distance = self.max_distance
+        max_length_ratio = self.max_length_ratio
+        min_jaccard = self.min_jaccard
         for sv_type, chromosomes in self.classified_events.items():
             if sv_type == "TRA":
-                for (_chr1, _chr2), events in chromosomes.items():
+                add_event = self.tra_merger.add_event
+                for events in chromosomes.values():
                     for event in events:
-                        self.tra_merger.add_event(event)
+                        add_event(event)
             elif sv_type == "BND":
-                for chromosome, events in chromosomes.items():
+                add_event = self.bnd_merger.add_event
+                for events in chromosomes.values():
                     for event in events:
-                        self.bnd_merger.add_event(event)
+                        add_event(event)
             else:
-                if sv_type not in self.merged_events:
-                    self.merged_events[sv_type] = {}
-                    self.event_groups[sv_type] = {}
-                for chromosome, events in chromosomes.items():
-                    if chromosome not in self.merged_events[sv_type]:
-                        self.merged_events[sv_type][chromosome] = []
-                        self.event_groups[sv_type][chromosome] = []
-                    for event in events:
-                        self.add_and_merge_event(sv_type, chromosome, event)
+                merged_by_chrom = self.merged_events.setdefault(sv_type, {})
+                groups_by_chrom = self.event_groups.setdefault(sv_type, {})
+                index_by_chrom = self._pos_index.setdefault(sv_type, {})
+                for chromosome, chrom_events in chromosomes.items():
+                    events = merged_by_chrom.setdefault(chromosome, [])
+                    event_groups = groups_by_chrom.setdefault(chromosome, [])
+                    pos_index = index_by_chrom.setdefault(chromosome, {})
+                    for new_event in chrom_events:
+                        bucket = new_event.start_pos // MAX_DISTANCE_THRESHOLD
+                        candidates = []
+                        for nearby in (bucket - 1, bucket, bucket + 1):
+                            indices = pos_index.get(nearby)
+                            if indices:
+                                candidates.extend(indices)
+                        # Test candidates in insertion order so the first
+                        # matching event wins, as the full scan did
+                        candidates.sort()
+                        for idx in candidates:
+                            if should_merge(events[idx], new_event, max_distance, max_length_ratio, min_jaccard):
+                                entry = event_groups[idx]
+                                entry["group"].append(new_event)
+                                entry["rep"] = None
+                                break
+                        else:
+                            pos_index.setdefault(bucket, []).append(len(events))
+                            events.append(new_event)
+                            event_groups.append({"group": [new_event], "rep": None})
 
     def add_and_merge_event(self, sv_type, chromosome, new_event):
         """Add a new event and merge it with existing events if possible."""
         events = self.merged_events[sv_type][chromosome]
         event_groups = self.event_groups[sv_type][chromosome]
-        for idx, existing_event in enumerate(events):
-            if should_merge(existing_event, new_event, self.max_distance, self.max_length_ratio, self.min_jaccard):
-                event_groups[idx].append(new_event)
+        pos_index = self._pos_index.setdefault(sv_type, {}).setdefault(chromosome, {})
+        self._partition_cache = None
+        self._all_merged_cache = None
+        bucket = new_event.start_pos // MAX_DISTANCE_THRESHOLD
+        candidates = []
+        for nearby in (bucket - 1, bucket, bucket + 1):
+            indices = pos_index.get(nearby)
+            if indices:
+                candidates.extend(indices)
+        candidates.sort()
+        for idx in candidates:
+            if should_merge(events[idx], new_event, self.max_distance, self.max_length_ratio, self.min_jaccard):
+                entry = event_groups[idx]
+                entry["group"].append(new_event)
+                entry["rep"] = None
                 return
+        pos_index.setdefault(bucket, []).append(len(events))
         events.append(new_event)
-        event_groups.append([new_event])
+        event_groups.append({"group": [new_event], "rep": None})
+
+    @staticmethod
+    def _rep(entry):
+        """Get the cached representative for a group entry, computing lazily.
+
+        The representative is invalidated (set to None) whenever the group
+        gains an event, so repeated traversals don't redo selection.
+        """
+        representative_sv = entry["rep"]
+        if representative_sv is None:
+            representative_sv = select_representative_sv(entry["group"])
+            entry["rep"] = representative_sv
+        return representative_sv
 
     def get_events(self, sv_type, chromosome, start, end):
         """Get events of given type within the specified region."""
@@ -85,8 +235,8 @@ class SVMerger:
             return self.bnd_merger.get_merged_events()
         if sv_type in self.event_groups and chromosome in self.event_groups[sv_type]:
             events = []
-            for sv_group in self.event_groups[sv_type][chromosome]:
-                representative_sv = select_representative_sv(sv_group)
+            for entry in self.event_groups[sv_type][chromosome]:
+                representative_sv = self._rep(entry)
                 if representative_sv.start_pos <= end and representative_sv.end_pos >= start:
                     events.append(representative_sv)
             return events
@@ -94,95 +244,98 @@ class SVMerger:
 
     def get_all_merged_events(self):
         """Get all merged events across all types and chromosomes."""
+        if self._all_merged_cache is not None:
+            return list(self._all_merged_cache)
         merged_events = []
         merged_events.extend(self.tra_merger.get_merged_events())
         merged_events.extend(self.bnd_merger.get_merged_events())
         for sv_type in self.event_groups:
             for chromosome in self.event_groups[sv_type]:
-                for sv_group in self.event_groups[sv_type][chromosome]:
-                    representative_sv = select_representative_sv(sv_group)
-                    merged_events.append(representative_sv)
-        return merged_events
+                for entry in self.event_groups[sv_type][chromosome]:
+                    merged_events.append(self._rep(entry))
+        self._all_merged_cache = merged_events
+        return list(merged_events)
+
+    def _partitioned_events(self):
+        """Get the merged TRA, BND, and other event lists, computed once.
+
+        Every query method needs the same three lists; recomputing them per
+        call repeats the TRA/BND merges and representative selection. The
+        cache is invalidated by merge().
+        """
+        if self._partition_cache is None:
+            tra_events = self.tra_merger.get_merged_events()
+            bnd_events = self.bnd_merger.get_merged_events()
+            other_events = []
+            for sv_type in self.event_groups:
+                for chromosome in self.event_groups[sv_type]:
+                    for entry in self.event_groups[sv_type][chromosome]:
+                        representative_sv = self._rep(entry)
+                        if representative_sv.sv_type not in ("TRA", "BND"):
+                            other_events.append(representative_sv)
+            self._partition_cache = (tra_events, bnd_events, other_events)
+        return self._partition_cache
+
+    @staticmethod
+    def _source_basenames(event):
+        """Get the set of source-file basenames for an event, cached on it.
+
+        Keyed by the source_file string itself, so representatives whose
+        sources are extended by later merging recompute naturally.
+        """
+        source_file = event.source_file
+        cached = getattr(event, "_source_basenames_cache", None)
+        if cached is not None and cached[0] == source_file:
+            return cached[1]
+        basenames = {os.path.basename(s) for s in source_file.split(",")}
+        event._source_basenames_cache = (source_file, basenames)
+        return basenames
 
     def get_events_by_source(self, sources, operation="union"):
         """Get events based on their source files and specified operation."""
-        tra_events = self.tra_merger.get_merged_events()
-        bnd_events = self.bnd_merger.get_merged_events()
-        other_events = self.get_all_merged_events()
-        other_events = [e for e in other_events if e.sv_type not in ["TRA", "BND"]]
-        sources_set = {os.path.basename(source) for source in sources}
+        tra_events, bnd_events, other_events = self._partitioned_events()
+        query_mask = 0
+        for source in sources:
+            query_mask |= self._bit_for(os.path.basename(source))
+        source_mask = self._source_mask
 
         if operation == "union":
-            tra_filtered = [
-                event for event in tra_events
-                if sources_set.intersection({os.path.basename(s) for s in event.source_file.split(",")})
-            ]
-            bnd_filtered = [
-                event for event in bnd_events
-                if sources_set.intersection({os.path.basename(s) for s in event.source_file.split(",")})
-            ]
-            other_filtered = [
-                event for event in other_events
-                if sources_set.intersection({os.path.basename(s) for s in event.source_file.split(",")})
-            ]
+            def predicate(event):
+                return query_mask & source_mask(event)
         elif operation == "intersection":
-            tra_filtered = [
-                event for event in tra_events
-                if sources_set.issubset({os.path.basename(s) for s in event.source_file.split(",")})
-            ]
-            bnd_filtered = [
-                event for event in bnd_events
-                if sources_set.issubset({os.path.basename(s) for s in event.source_file.split(",")})
-            ]
-            other_filtered = [
-                event for event in other_events
-                if sources_set.issubset({os.path.basename(s) for s in event.source_file.split(",")})
-            ]
+            def predicate(event):
+                return source_mask(event) & query_mask == query_mask
         elif operation == "specific":
-            source_file = next(iter(sources_set))
-            other_files = {os.path.basename(f) for f in self.all_input_files} - {source_file}
-            tra_filtered = [
-                event for event in tra_events
-                if source_file in [os.path.basename(s) for s in event.source_file.split(",")] and not any(
-                    other in [os.path.basename(s) for s in event.source_file.split(",")] for other in other_files
-                )
-            ]
-            bnd_filtered = [
-                event for event in bnd_events
-                if source_file in [os.path.basename(s) for s in event.source_file.split(",")] and not any(
-                    other in [os.path.basename(s) for s in event.source_file.split(",")] for other in other_files
-                )
-            ]
-            other_filtered = [
-                event for event in other_events
-                if source_file in [os.path.basename(s) for s in event.source_file.split(",")] and not any(
-                    other in [os.path.basename(s) for s in event.source_file.split(",")] for other in other_files
-                )
-            ]
+            source_bit = self._bit_for(os.path.basename(next(iter(sources))))
+            # Bits of every *other* input file; extra bits assigned to
+            # unexpected sources deliberately don't disqualify an event,
+            # matching the old set-difference against input basenames
+            others_mask = self._input_files_mask & ~source_bit
+
+            def predicate(event):
+                mask = source_mask(event)
+                return mask & source_bit and not mask & others_mask
         else:
             msg = f"Unsupported operation: {operation}"
             raise ValueError(msg)
 
-        return other_filtered + tra_filtered + bnd_filtered
+        # One pass over the event universe, preserving the other/tra/bnd
+        # output order of the previous three separate comprehensions
+        return [event for event in itertools.chain(other_events, tra_events, bnd_events) if predicate(event)]
 
     def get_events_by_exact_support(self, exact_support):
         """Get events supported by exactly N files."""
-        tra_events = self.tra_merger.get_merged_events()
-        bnd_events = self.bnd_merger.get_merged_events()
-        other_events = self.get_all_merged_events()
-        other_events = [e for e in other_events if e.sv_type not in ["TRA", "BND"]]
+        tra_events, bnd_events, other_events = self._partitioned_events()
 
-        tra_filtered = [event for event in tra_events if len(set(event.source_file.split(","))) == exact_support]
-        bnd_filtered = [event for event in bnd_events if len(set(event.source_file.split(","))) == exact_support]
-        other_filtered = [event for event in other_events if len(set(event.source_file.split(","))) == exact_support]
-        return other_filtered + tra_filtered + bnd_filtered
+        return [
+            event
+            for event in itertools.chain(other_events, tra_events, bnd_events)
+            if len(set(event.source_file.split(","))) == exact_support
+        ]
 
     def get_events_by_support_range(self, min_support=None, max_support=None):
         """Get events supported by a range of files."""
-        tra_events = self.tra_merger.get_merged_events()
-        bnd_events = self.bnd_merger.get_merged_events()
-        other_events = self.get_all_merged_events()
-        other_events = [e for e in other_events if e.sv_type not in ["TRA", "BND"]]
+        tra_events, bnd_events, other_events = self._partitioned_events()
 
         def within_range(event):
             support_count = len(set(event.source_file.split(",")))
@@ -190,58 +343,57 @@ class SVMerger:
                 return False
             return not (max_support is not None and support_count > max_support)
 
-        tra_filtered = [event for event in tra_events if within_range(event)]
-        bnd_filtered = [event for event in bnd_events if within_range(event)]
-        other_filtered = [event for event in other_events if within_range(event)]
-        return other_filtered + tra_filtered + bnd_filtered
+        return [event for event in itertools.chain(other_events, tra_events, bnd_events) if within_range(event)]
 
     def get_events_by_expression(self, expression):
         """Get events that satisfy a logical expression."""
-        tra_events = self.tra_merger.get_merged_events()
-        bnd_events = self.bnd_merger.get_merged_events()
-        other_events = self.get_all_merged_events()
-        other_events = [e for e in other_events if e.sv_type not in ["TRA", "BND"]]
-
-        tra_filtered = [
-            event for event in tra_events
-            if self.evaluate_expression(expression, [os.path.basename(s) for s in event.source_file.split(",")])
-        ]
-        bnd_filtered = [
-            event for event in bnd_events
-            if self.evaluate_expression(expression, [os.path.basename(s) for s in event.source_file.split(",")])
-        ]
-        other_filtered = [
-            event for event in other_events
-            if self.evaluate_expression(expression, [os.path.basename(s) for s in event.source_file.split(",")])
-        ]
-        return other_filtered + tra_filtered + bnd_filtered
+        tra_events, bnd_events, other_events = self._partitioned_events()
 
-    def evaluate_expression(self, expression, event_sources):
-        """Evaluate a logical expression against event sources."""
+        predicate = self._compile_expression(expression)
+        source_mask = self._source_mask
+        try:
+            return [
+                event
+                for event in itertools.chain(other_events, tra_events, bnd_events)
+                if predicate(source_mask(event))
+            ]
+        except Exception as e:
+            msg = f"Invalid expression: {e}"
+            raise ValueError(msg)
 
-        def make_identifier(file_path):
-            file_name = os.path.basename(file_path)
-            return re.sub(r"\W|^(?=\d)", "_", file_name)
+    def _compile_expression(self, expression):
+        """Compile a logical expression into a predicate over a source bitmask.
 
-        context = {}
-        all_sources = set(self.all_input_files)
-        for source in all_sources:
-            identifier = make_identifier(source)
-            context[identifier] = False
+        Each known source name (basename or sanitized identifier) is rewritten
+        to a bit test against the mask layout built in __init__, so evaluating
+        an event costs one call to a tiny compiled function on an int instead
+        of populating a truth dict and running eval per event.
+        """
+        predicate = self._compiled_expr_cache.get(expression)
+        if predicate is None:
+            expr = expression
+            if self._token_re is not None:
+                expr = self._token_re.sub(lambda m: f"(mask & {self._bit_by_token[m.group(1)]} != 0)", expr)
+            expr = expr.replace("AND", "and").replace("OR", "or").replace("NOT", "not")
+            try:
+                predicate = eval(  # noqa: S307 - builtins stripped, input rewritten above
+                    f"lambda mask: ({expr})", {"__builtins__": {}}, {}
+                )
+            except SyntaxError as e:
+                msg = f"Invalid expression: {e}"
+                raise ValueError(msg)
+            self._compiled_expr_cache[expression] = predicate
+        return predicate
 
+    def evaluate_expression(self, expression, event_sources):
+        """Evaluate a logical expression against event sources."""
+        mask = 0
         for source in event_sources:
-            identifier = make_identifier(source)
-            context[identifier] = True
-
-        expr = expression
-        for source in all_sources:
-            identifier = make_identifier(source)
-            expr = re.sub(r"\b" + re.escape(os.path.basename(source)) + r"\b", identifier, expr)
-
-        expr = expr.replace("AND", "and").replace("OR", "or").replace("NOT", "not")
-
+            mask |= self._bit_for(os.path.basename(source))
         try:
-            return eval(expr, {"__builtins__": {}}, context)
+            return self._compile_expression(expression)(mask)
+        except ValueError:
+            raise
         except Exception as e:
             msg = f"Invalid expression: {e}"
             raise ValueError(msg)
@@ -255,22 +407,19 @@ class SVMerger:
         Returns:
             list: List of source file paths ordered by input file order
         """
-        # Get source files from the event
-        source_files = event.source_file.split(",")
-        source_files = [f.strip() for f in source_files]
-
-        # Order them according to the input file order
-        ordered_sources = []
-        for input_file in self.all_input_files:
-            input_basename = os.path.basename(input_file)
-            # Check if this input file is among the event's sources
-            for source_file in source_files:
-                source_basename = os.path.basename(source_file)
-                if input_basename == source_basename:
-                    ordered_sources.append(source_file)
-                    break
-
-        return ordered_sources
+        # Map each source onto its input-file position via one dict lookup
+        # per source instead of scanning all input files per event. The first
+        # source matching an input file wins and unmatched sources are
+        # dropped, as the old nested scan did.
+        order = self._input_file_order
+        source_by_position = {}
+        for source_file in event.source_file.split(","):
+            source_file = source_file.strip()
+            position = order.get(os.path.basename(source_file))
+            if position is not None and position not in source_by_position:
+                source_by_position[position] = source_file
+
+        return [source_by_position[position] for position in sorted(source_by_position)]
 
     def _reorder_merged_samples(self, event, ordered_sources):
         """Reorder merged_samples to match the ordered_sources sequence.
@@ -294,6 +443,15 @@ class SVMerger:
         unmatched_samples = []
 
         for sample_name, sample_format, sample_data in merged_samples:
+            # Fast path: samples tagged with their canonical source key during
+            # representative selection bucket with one dict lookup
+            if isinstance(sample_data, dict):
+                bucket = samples_by_source.get(sample_data.get("__source_key__"))
+                if bucket is not None:
+                    bucket.append((sample_name, sample_format, sample_data))
+                    continue
+
+            # Fallback: substring matching for untagged or legacy samples
             matched = False
             sample_str = str(sample_data).lower()
 
@@ -335,10 +493,7 @@ class SVMerger:
                 value = "."
             values.append(str(value))
 
-        result = ":".join(values)
-        if result.endswith(":.:."):
-            result = result[:-4]
-        return result
+        return strip_missing_tail(":".join(values))
 
     def write_results(self, output_file, events, contigs, mode="caller", name_mapper=None):
         """Write merged results to output file with consistent SOURCES and SAMPLE ordering."""
@@ -348,87 +503,126 @@ class SVMerger:
             writer = MultiSampleWriter(name_mapper)
             writer.write_results(output_file, events, contigs, self)
         else:
-            # Enhanced caller mode with consistent ordering
-            with open(output_file, "w") as f:
+            # Enhanced caller mode with consistent ordering; the file is
+            # written in binary with records buffered and encoded per batch,
+            # skipping the text-layer encode/lock on every write call
+            with open(output_file, "wb", buffering=1 << 20) as f:
                 # Write VCF header
-                f.write("##fileformat=VCFv4.2\n")
                 file_date = datetime.datetime.now().strftime("%Y-%m-%d|%I:%M:%S%p|")
-                f.write(f"##fileDate={file_date}\n")
-                f.write("##source=OctopuSV\n")
+                header_parts = [
+                    "##fileformat=VCFv4.2\n",
+                    f"##fileDate={file_date}\n",
+                    "##source=OctopuSV\n",
+                ]
 
                 # Write contig information
                 for contig_id, contig_length in contigs.items():
-                    f.write(f"##contig=<ID={contig_id},length={contig_length}>\n")
+                    header_parts.append(f"##contig=<ID={contig_id},length={contig_length}>\n")
 
                 # Write column headers
                 sample_names = ["SAMPLE"]
-                header_line = "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\t" + "\t".join(sample_names) + "\n"
-                f.write(header_line)
-
-                for event in events:
-                    # Step 1: Get ordered sources according to input file order
-                    ordered_sources = self._get_ordered_sources_for_event(event)
-
-                    # Step 2: Generate SOURCES field with consistent ordering
-                    if name_mapper:
-                        # Apply name mapping to get display names
-                        display_sources = ",".join([name_mapper.get_display_name(f) for f in ordered_sources])
-                    else:
-                        # Use basename without name mapping
-                        display_sources = ",".join([os.path.splitext(os.path.basename(f))[0] for f in ordered_sources])
-
-                    # Step 3: Prepare INFO field with ordered SOURCES
-                    info_items = []
-                    for k, v in event.info.items():
-                        if k == "SOURCES":
-                            # Replace with our ordered sources
-                            info_items.append(f"SOURCES={display_sources}")
+                header_parts.append(
+                    "#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\t" + "\t".join(sample_names) + "\n"
+                )
+                f.write("".join(header_parts).encode("utf-8"))
+
+                # Encoded batches are handed to a background thread over a
+                # bounded queue so formatting the next batch overlaps with the
+                # previous batch's write syscall
+                write_queue = queue.Queue(maxsize=4)
+                writer_thread = threading.Thread(target=drain_writes, args=(write_queue, f), daemon=True)
+                writer_thread.start()
+                try:
+                    record_buffer = []
+                    # Consecutive events overwhelmingly share a FORMAT string,
+                    # so split it once per distinct FORMAT rather than per event
+                    format_keys_cache = {}
+                    for event in events:
+                        # Step 1: Get ordered sources according to input file order
+                        ordered_sources = self._get_ordered_sources_for_event(event)
+
+                        # Step 2: Generate SOURCES field with consistent ordering
+                        if name_mapper:
+                            # Apply name mapping to get display names
+                            display_sources = ",".join([name_mapper.get_display_name(f) for f in ordered_sources])
                         else:
-                            info_items.append(f"{k}={v}")
-
-                    info_field = ";".join(info_items)
-                    if "SOURCES" not in info_field:
-                        info_field += f";SOURCES={display_sources}"
-
-                    # Step 4: Get FORMAT field
-                    format_field = event.format
-                    format_keys = format_field.split(":")
-
-                    # Step 5: Reorder sample data to match ordered_sources
-                    merged_samples = getattr(event, "merged_samples", [])
-                    if merged_samples:
-                        # Reorder merged_samples to match ordered_sources
-                        reordered_samples = self._reorder_merged_samples(event, ordered_sources)
-
-                        # Format sample strings in the correct order
-                        sample_strings = []
-                        for _, _, sample_data in reordered_samples:
-                            if isinstance(sample_data, dict):
-                                values = []
-                                for key in format_keys:
-                                    value = sample_data.get(key, ".")
-                                    values.append(str(value))
-                                sample_str = ":".join(values)
-                                if sample_str.endswith(":.:."):
-                                    sample_str = sample_str[:-4]
-                                sample_strings.append(sample_str)
+                            # Use basename without name mapping
+                            display_sources = ",".join(
+                                [os.path.splitext(os.path.basename(f))[0] for f in ordered_sources]
+                            )
+
+                        # Step 3: Prepare INFO field with ordered SOURCES;
+                        # remember whether the loop emitted a SOURCES item
+                        # instead of re-scanning the joined string
+                        info_items = []
+                        sources_emitted = False
+                        for k, v in event.info.items():
+                            if k == "SOURCES":
+                                # Replace with our ordered sources
+                                info_items.append(f"SOURCES={display_sources}")
+                                sources_emitted = True
                             else:
-                                sample_str = str(sample_data)
-                                if sample_str.endswith(":.:."):
-                                    sample_str = sample_str[:-4]
-                                sample_strings.append(sample_str)
-
-                        sample_part = "\t".join(sample_strings)
-                    elif hasattr(event, "sample"):
-                        # Single sample case
-                        formatted_values = self.format_sample_values(format_keys, event.sample)
-                        if formatted_values.endswith(":.:."):
-                            formatted_values = formatted_values[:-4]
-                        sample_part = formatted_values
-                    else:
-                        sample_part = "./."
-
-                    # Step 6: Write the complete record
-                    record_part1 = f"{event.chrom}\t{event.pos}\t{event.sv_id}\t{event.ref}\t{event.alt}\t"
-                    record_part2 = f"{event.quality}\t{event.filter}\t{info_field}\t{format_field}\t"
-                    f.write(record_part1 + record_part2 + sample_part + "\n")
\ No newline at end of file
+                                info_items.append(f"{k}={v}")
+
+                        if not sources_emitted:
+                            info_items.append(f"SOURCES={display_sources}")
+                        info_field = ";".join(info_items)
+
+                        # Step 4: Get FORMAT field (key split cached per FORMAT)
+                        format_field = event.format
+                        cached_fmt = format_keys_cache.get(format_field)
+                        if cached_fmt is None:
+                            format_keys = tuple(sys.intern(k) for k in format_field.split(":"))
+                            # A single-key getter returns a scalar rather than
+                            # a tuple, so only build one for multi-key FORMATs
+                            getter = operator.itemgetter(*format_keys) if len(format_keys) > 1 else None
+                            cached_fmt = (format_keys, getter)
+                            format_keys_cache[format_field] = cached_fmt
+                        format_keys, getter = cached_fmt
+
+                        # Step 5: Reorder sample data to match ordered_sources
+                        merged_samples = getattr(event, "merged_samples", [])
+                        if merged_samples:
+                            # Reorder merged_samples to match ordered_sources
+                            reordered_samples = self._reorder_merged_samples(event, ordered_sources)
+
+                            # Format sample strings in the correct order
+                            sample_strings = []
+                            for _, _, sample_data in reordered_samples:
+                                if isinstance(sample_data, dict):
+                                    # One C-level itemgetter call fetches all
+                                    # values when every key is present (the
+                                    # common case); fall back to per-key gets
+                                    # otherwise
+                                    if getter is not None:
+                                        try:
+                                            values = [str(v) for v in getter(sample_data)]
+                                        except KeyError:
+                                            values = [str(sample_data.get(key, ".")) for key in format_keys]
+                                    else:
+                                        values = [str(sample_data.get(key, ".")) for key in format_keys]
+                                    sample_strings.append(strip_missing_tail(":".join(values)))
+                                else:
+                                    sample_strings.append(strip_missing_tail(str(sample_data)))
+
+                            sample_part = "\t".join(sample_strings)
+                        elif hasattr(event, "sample"):
+                            # Single sample case
+                            sample_part = strip_missing_tail(self.format_sample_values(format_keys, event.sample))
+                        else:
+                            sample_part = "./."
+
+                        # Step 6: Buffer the complete record
+                        record_buffer.append(
+                            f"{event.chrom}\t{event.pos}\t{event.sv_id}\t{event.ref}\t{event.alt}\t"
+                            f"{event.quality}\t{event.filter}\t{info_field}\t{format_field}\t{sample_part}\n"
+                        )
+                        if len(record_buffer) >= 8192:
+                            write_queue.put("".join(record_buffer).encode("utf-8"))
+                            record_buffer.clear()
+
+                    if record_buffer:
+                        write_queue.put("".join(record_buffer).encode("utf-8"))
+                finally:
+                    write_queue.put(None)
+                    writer_thread.join()
\ No newline at end of file
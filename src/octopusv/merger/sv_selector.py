@@ -1,3 +1,6 @@
+import os
+
+
 def get_caller_name(sample_dict):
     """Get standardized caller name from sample dictionary.
     Handles different formats of caller names.
@@ -62,12 +65,26 @@ def select_representative_sv(sv_group, weights=None, max_support=30, max_qual=10
     merged_samples_list = []
 
     for sv in sv_group:
+        # Remember where this record originally came from: a previously
+        # selected representative has its source_file overwritten with the
+        # merged list below, so the origin is stashed on first sight.
+        origin_source = getattr(sv, "_origin_source", None)
+        if origin_source is None:
+            origin_source = sv.source_file
+            sv._origin_source = origin_source
+
         # Add source file
         source_files = sv.source_file.split(",")
         all_source_files.update(source_files)
 
-        # Add sample information
-        sample_info = (sv.sample_name, sv.format, sv.sample)
+        # Add sample information, tagging the sample with a canonical source
+        # key so writers can reorder samples by hash lookup instead of
+        # substring matching
+        sample = sv.sample
+        if isinstance(sample, dict) and "__source_key__" not in sample:
+            first_source = origin_source.split(",")[0]
+            sample["__source_key__"] = os.path.splitext(os.path.basename(first_source))[0].lower()
+        sample_info = (sv.sample_name, sv.format, sample)
         merged_samples_list.append(sample_info)
 
         # Calculate support score
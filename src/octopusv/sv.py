@@ -17,6 +17,26 @@ class SVType(Enum):
 class SVEvent:
     """represent each SV event."""
 
+    # Slot layout instead of per-instance __dict__: saves ~60 B per event and
+    # makes the chrom/pos/alt lookups in the hot loops C-level offset reads.
+    # source and _alt_chrom_pos_cache are assigned after construction.
+    __slots__ = (
+        "chrom",
+        "pos",
+        "id",
+        "ref",
+        "alt",
+        "orig_alt",
+        "qual",
+        "filter",
+        "info",
+        "format",
+        "sample",
+        "source",
+        "_alt_chrom_pos_cache",
+        "_bnd_pattern_cache",
+    )
+
     def __init__(self, chrom, pos, id, ref, alt, qual, filter, info, format="GT", sample="0/1"):
         self.chrom = chrom
         self.pos = int(pos)
@@ -1,7 +1,11 @@
+from itertools import chain
+
 from .base import EventTransformer
-from octopusv.converter.bnd2del import BNDPairToDELConverter
-from octopusv.converter.bnd2dup_pair import BNDPairToDUPConverter
-from octopusv.converter.bnd2inv_pair import BNDPairToINVConverter
+from octopusv.converter.bnd_pair_classifier import BNDPairClassifier
+
+# The classifier is stateless between calls, so one instance serves every
+# apply_transforms invocation.
+_CLASSIFIER = BNDPairClassifier()
 
 
 class SameChrSVTransformer(EventTransformer):
@@ -15,30 +19,32 @@ class SameChrSVTransformer(EventTransformer):
     def apply_transforms(self, events):
         """Apply all transformation strategies to a list of events."""
 
-        # First, try to convert DEL pairs
-        del_converter = BNDPairToDELConverter()
-        events_after_del, converted_del_events = del_converter.find_and_convert_pairs(events)
-
-        # Then, try to convert DUP pairs from remaining events
-        dup_converter = BNDPairToDUPConverter()
-        events_after_dup, converted_dup_events = dup_converter.find_and_convert_pairs(events_after_del)
-
-        # Then, try to convert INV pairs from remaining events
-        inv_converter = BNDPairToINVConverter()
-        events_to_process, converted_inv_events = inv_converter.find_and_convert_pairs(events_after_dup)
+        # Classify DEL, DUP and INV pairs in a single traversal
+        events_to_process, converted_del_events, converted_dup_events, converted_inv_events = (
+            _CLASSIFIER.find_and_convert(events)
+        )
 
         # Finally, apply regular converters to remaining events
         for event in events_to_process:
             for strategy in self.transform_strategies:
                 strategy.convert(event)
 
-        # Combine all events
-        return events_to_process + converted_del_events + converted_dup_events + converted_inv_events
+        # Combine all events in one pass instead of allocating the
+        # intermediate lists repeated + concatenation would create
+        return list(chain(events_to_process, converted_del_events, converted_dup_events, converted_inv_events))
 
     def write_vcf(self, headers, events, output_file):
         """Write the transformed events to a VCF file."""
-        with open(output_file, "w") as f:
-            for header in headers:
-                f.write(header + "\n")
+        # Records are buffered and flushed in batches, so each event costs a
+        # list append instead of its own write call
+        with open(output_file, "w", buffering=1 << 20) as f:
+            if headers:
+                f.write("\n".join(headers) + "\n")
+            buf = []
             for event in events:
-                f.write(str(event) + "\n")
\ No newline at end of file
+                buf.append(str(event))
+                if len(buf) >= 8192:
+                    f.write("\n".join(buf) + "\n")
+                    buf.clear()
+            if buf:
+                f.write("\n".join(buf) + "\n")
\ No newline at end of file
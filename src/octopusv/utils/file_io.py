@@ -0,0 +1,20 @@
+VCF_READ_BUFFER_SIZE = 1 << 20  # 1 MiB
+
+
+def open_vcf(vcf_file_path):
+    """Open a VCF/SVCF file for reading with a large buffer.
+
+    The default ~8 KiB buffer causes excessive syscalls on network
+    filesystems (Lustre/NFS) common on HPC clusters; a 1 MiB buffer keeps
+    sequential header and record scans cheap.
+    """
+    return open(vcf_file_path, buffering=VCF_READ_BUFFER_SIZE)
+
+
+def open_vcf_bytes(vcf_file_path):
+    """Open a VCF/SVCF file in binary mode with a large buffer.
+
+    For header-only scans it skips decoding every record line to unicode;
+    callers decode just the few header lines they actually consume.
+    """
+    return open(vcf_file_path, "rb", buffering=VCF_READ_BUFFER_SIZE)
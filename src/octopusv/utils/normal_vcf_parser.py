@@ -3,6 +3,7 @@ import re
 import sys
 
 from octopusv.sv import SVEvent
+from octopusv.utils.file_io import open_vcf
 
 
 def is_same_chr_bnd(event):
@@ -26,77 +27,75 @@ def check_vcf_format(vcf_file_path):
     Allow both standard VCF (10 columns) and simplified VCF (8 columns) formats.
     Raise an error and exit if the format is incorrect.
     """
-    with open(vcf_file_path) as f:
-        lines = f.readlines()
-
-    # Check if there is at least one header line
-    if not any(line.startswith("#") for line in lines):
-        logging.error(
-            "Invalid VCF format. The file should contain at least one header line starting with '#'.",
-        )
-        sys.exit(1)
-
-    for line in lines:
-        if line.startswith("#"):
-            continue  # Skip header lines
+    has_header_line = False
+    with open_vcf(vcf_file_path) as f:
+        for line in f:
+            if line.startswith("#"):
+                has_header_line = True
+                continue  # Skip header lines
 
-        # Check for space in lines
-        if " " in line:
-            logging.error(
-                "Invalid VCF format. Non-header lines should not contain spaces.",
-            )
-            sys.exit(1)
+            # Check for space in lines
+            if " " in line:
+                logging.error(
+                    "Invalid VCF format. Non-header lines should not contain spaces.",
+                )
+                sys.exit(1)
 
-        fields = line.strip().split("\t")
+            fields = line.strip().split("\t")
 
-        # Check the minimum number of columns (8 for simplified VCF)
-        if len(fields) < 8:
-            logging.error(
-                f"Invalid VCF format. Expected at least 8 fields, but got {len(fields)}",
-            )
-            sys.exit(1)
-
-        # Check that the position is a number
-        try:
-            int(fields[1])
-        except ValueError:
-            logging.error(
-                f"Invalid VCF format. Position (field 2) should be a number, but got {fields[1]}",
-            )
-            sys.exit(1)
+            # Check the minimum number of columns (8 for simplified VCF)
+            if len(fields) < 8:
+                logging.error(
+                    f"Invalid VCF format. Expected at least 8 fields, but got {len(fields)}",
+                )
+                sys.exit(1)
 
-        # Check that the quality score is a number or '.'
-        if fields[5] != ".":
+            # Check that the position is a number
             try:
-                float(fields[5])
+                int(fields[1])
             except ValueError:
                 logging.error(
-                    f"Invalid VCF format. Quality score (field 6) should be a number or '.', but got {fields[5]}",
+                    f"Invalid VCF format. Position (field 2) should be a number, but got {fields[1]}",
                 )
                 sys.exit(1)
 
+            # Check that the quality score is a number or '.'
+            if fields[5] != ".":
+                try:
+                    float(fields[5])
+                except ValueError:
+                    logging.error(
+                        f"Invalid VCF format. Quality score (field 6) should be a number or '.', but got {fields[5]}",
+                    )
+                    sys.exit(1)
+
+    # Check if there is at least one header line
+    if not has_header_line:
+        logging.error(
+            "Invalid VCF format. The file should contain at least one header line starting with '#'.",
+        )
+        sys.exit(1)
 
-def parse_vcf(vcf_file_path):
-    """Parse VCF file into lists of SVEvent objects based on their type.
 
+def iter_vcf(vcf_file_path):
+    """Stream tagged records from a VCF file instead of materializing full lists.
+
+    Yields ("contig", line) for ##contig header lines and ("same_chr_bnd", event),
+    ("diff_chr_bnd", event) or ("non_bnd", event) for data records, in file order.
     Handles both standard VCF (10 columns) and simplified VCF (8 columns) formats.
     """
     check_vcf_format(vcf_file_path)  # Check the format first
-    same_chr_bnd_events = []
-    diff_chr_bnd_events = []
-    non_bnd_events = []
-    contig_lines = []  # Store ##contig lines here
     is_svaba_output = False  # Flag to detect if it's SVABA output
     source_info = "."  # Default value of source
 
-    with open(vcf_file_path) as f:
+    with open_vcf(vcf_file_path) as f:
         for line in f:
             if line.startswith("##source="):
                 source_info = line.split("=")[1].split(" ")[0].strip()
                 if "svaba" in line.lower():
                     is_svaba_output = True
             elif line.startswith("##contig"):
-                contig_lines.append(line.strip())
+                yield "contig", line.strip()
             elif not line.startswith("#"):  # Skip all header lines except ##contig
                 fields = line.strip().split("\t")
 
@@ -117,10 +116,29 @@ def parse_vcf(vcf_file_path):
 
                 if event.is_BND():
                     if is_same_chr_bnd(event):  # Check if the event is same chromosome
-                        same_chr_bnd_events.append(event)
+                        yield "same_chr_bnd", event
                     else:
-                        diff_chr_bnd_events.append(event)  # Different chromosome
+                        yield "diff_chr_bnd", event  # Different chromosome
                 else:
-                    non_bnd_events.append(event)  # Non-BND events
+                    yield "non_bnd", event  # Non-BND events
+
+
+def parse_vcf(vcf_file_path):
+    """Parse VCF file into lists of SVEvent objects based on their type.
+
+    Thin materializer over iter_vcf for callers that need full lists.
+    """
+    same_chr_bnd_events = []
+    diff_chr_bnd_events = []
+    non_bnd_events = []
+    contig_lines = []  # Store ##contig lines here
+    sinks = {
+        "contig": contig_lines.append,
+        "same_chr_bnd": same_chr_bnd_events.append,
+        "diff_chr_bnd": diff_chr_bnd_events.append,
+        "non_bnd": non_bnd_events.append,
+    }
+    for kind, record in iter_vcf(vcf_file_path):
+        sinks[kind](record)
 
     return contig_lines, same_chr_bnd_events, diff_chr_bnd_events, non_bnd_events
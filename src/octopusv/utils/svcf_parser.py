@@ -2,6 +2,8 @@ import logging
 import os
 import re
 
+from octopusv.utils.file_io import open_vcf
+
 
 class SVCFEvent:
     """Represents a structural variant (SV) event parsed from an SVCF file.
@@ -189,7 +191,7 @@ class SVCFFileEventCreator:
     def parse(self):
         """Parses each file in the filenames list, creating SVCFEvent objects for each valid SV record."""
         for filename in self.filenames:
-            with open(filename) as file:
+            with open_vcf(filename) as file:
                 sample_name = None
                 for line in file:
                     if line.startswith("#CHROM"):